@@ -5,11 +5,10 @@ Run with: streamlit run dashboard.py
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sqlite3
-import json
-from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
+import os
+import threading
 
 # Configure page
 st.set_page_config(
@@ -18,103 +17,228 @@ st.set_page_config(
     layout="wide"
 )
 
-def load_data():
-    """Load data from SQLite database"""
+DB_PATH = 'pool_listener.db'
+
+@st.cache_resource
+def _connection_store():
+    """Thread-local holder so concurrent loaders each get their own connection"""
+    return threading.local()
+
+def get_connection():
+    """Read-only SQLite connection, reused across Streamlit reruns
+
+    Read-only mode plus WAL journaling (enabled by the listener at startup)
+    means dashboard reads never contend with the listener's writes. One
+    connection per thread keeps parallel queries from serializing on a
+    shared pysqlite handle.
+    """
+    local = _connection_store()
+    if not hasattr(local, 'connection'):
+        local.connection = sqlite3.connect(f'file:{DB_PATH}?mode=ro', uri=True,
+                                           check_same_thread=False)
+    return local.connection
+
+def _db_mtime():
+    """Freshness token - cache keys below invalidate only when the DB file changes"""
+    try:
+        return os.path.getmtime(DB_PATH)
+    except OSError:
+        return 0
+
+def _read_df(sql):
+    """Run a query on the shared connection and build a DataFrame directly
+
+    A raw cursor + from_records skips read_sql_query's per-call type
+    inference and wrapper overhead - for these small result sets the
+    fixed Python cost dominates.
+    """
+    cursor = get_connection().execute(sql)
+    columns = [d[0] for d in cursor.description]
+    return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_pools(db_mtime):
+    """Load pools data (only the columns the dashboard actually renders)"""
+    pools_df = _read_df("""
+        SELECT address, fee, current_liquidity, is_tradeable, discovered_at
+        FROM discovered_pools
+        ORDER BY discovered_at DESC
+        LIMIT 10000
+    """)
+    if not pools_df.empty:
+        pools_df['discovered_at'] = pd.to_datetime(pools_df['discovered_at'])
+    return pools_df
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_notifications(db_mtime):
+    """Load notifications data (only the columns the dashboard actually renders)"""
+    notifications_df = _read_df("""
+        SELECT pool_address, notification_type, success, sent_at
+        FROM notification_log
+        ORDER BY sent_at DESC
+        LIMIT 10000
+    """)
+    if not notifications_df.empty:
+        notifications_df['sent_at'] = pd.to_datetime(notifications_df['sent_at'])
+    return notifications_df
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_daily_pools(db_mtime):
+    """Daily discovery counts, aggregated in SQLite instead of pandas"""
+    return _read_df("""
+        SELECT DATE(discovered_at) AS day, COUNT(*) AS n
+        FROM discovered_pools
+        GROUP BY DATE(discovered_at)
+        ORDER BY day
+    """)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _liquidity_histogram(db_mtime, nbins=20):
+    """Pre-binned liquidity histogram - sends nbins bars to the browser, not N points"""
+    pools_df = _load_pools(db_mtime)
+    counts, edges = np.histogram(pools_df['current_liquidity'].to_numpy(), bins=nbins)
+    return counts, edges
+
+METRICS_PORT = int(os.getenv('METRICS_PORT', '8000'))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_listener_counts(db_mtime):
+    """Read pool/notification counts from the listener's /metrics endpoint
+
+    The running listener already knows these totals, so a tiny HTTP GET
+    keeps the top-of-page cards O(1) in DB size. Returns None when the
+    listener isn't running so the caller can fall back to SQL.
+    """
+    import re
+    import requests
+    try:
+        text = requests.get(f'http://localhost:{METRICS_PORT}/metrics', timeout=0.5).text
+    except requests.RequestException:
+        return None
+
+    def _metric_sum(name):
+        values = re.findall(rf'^{name}(?:{{[^}}]*}})? ([0-9.e+]+)$', text, re.MULTILINE)
+        return int(sum(float(v) for v in values)) if values else None
+
+    n_pools = _metric_sum('active_pools_total')
+    n_tradeable = _metric_sum('tradeable_pools_total')
+    n_notifs = _metric_sum('notifications_sent_total')
+    if None in (n_pools, n_tradeable, n_notifs):
+        return None
+    return n_pools, n_tradeable, n_notifs
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_metrics(db_mtime):
+    """All four metric-card values from aggregate queries - no bulk reads
+
+    Falls back to zeros when the database doesn't exist yet (read-only
+    connect raises), so the page shows the "No data" warning instead of
+    a traceback before the listener's first run.
+    """
     try:
-        conn = sqlite3.connect('pool_listener.db')
-        
-        # Load pools data
-        pools_df = pd.read_sql_query("""
-            SELECT * FROM discovered_pools 
-            ORDER BY discovered_at DESC
-        """, conn)
-        
-        # Load notifications data  
-        notifications_df = pd.read_sql_query("""
-            SELECT * FROM notification_log 
-            ORDER BY sent_at DESC
-        """, conn)
-        
-        conn.close()
-        return pools_df, notifications_df
-    except Exception as e:
-        st.error(f"Database error: {e}")
-        return pd.DataFrame(), pd.DataFrame()
+        conn = get_connection()
+        n_pools, n_tradeable, avg_liq = conn.execute("""
+            SELECT COUNT(*), COALESCE(SUM(is_tradeable), 0), COALESCE(AVG(current_liquidity), 0)
+            FROM discovered_pools
+        """).fetchone()
+        n_notifs = conn.execute("SELECT COUNT(*) FROM notification_log").fetchone()[0]
+        return n_pools, n_tradeable, avg_liq, n_notifs
+    except (sqlite3.Error, OSError) as e:
+        st.warning(f"Database not available yet: {e}")
+        return 0, 0, 0.0, 0
 
 def main():
     st.title("🏊 Enhanced Pool Listener Dashboard")
     st.markdown("---")
     
-    # Load data
-    pools_df, notifications_df = load_data()
-    
-    if pools_df.empty:
-        st.warning("No data available. Make sure the Enhanced Pool Listener is running.")
-        return
-    
-    # Metrics row
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Pools", len(pools_df))
-    
-    with col2:
-        tradeable_count = len(pools_df[pools_df['is_tradeable'] == True])
-        st.metric("Tradeable Pools", tradeable_count)
-    
-    with col3:
-        total_notifications = len(notifications_df)
-        st.metric("Notifications Sent", total_notifications)
-    
-    with col4:
-        if not pools_df.empty:
-            avg_liquidity = pools_df['current_liquidity'].mean()
-            st.metric("Avg Liquidity", f"{avg_liquidity:,.0f}")
-    
-    st.markdown("---")
-    
-    # Charts
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("📈 Pool Discovery Timeline")
-        if not pools_df.empty:
-            pools_df['discovered_at'] = pd.to_datetime(pools_df['discovered_at'])
-            daily_pools = pools_df.groupby(pools_df['discovered_at'].dt.date).size()
-            
-            fig = px.line(x=daily_pools.index, y=daily_pools.values,
-                         title="Pools Discovered Per Day")
-            fig.update_layout(xaxis_title="Date", yaxis_title="Pools")
-            st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.subheader("💰 Liquidity Distribution")
-        if not pools_df.empty:
-            fig = px.histogram(pools_df, x='current_liquidity', nbins=20,
-                             title="Pool Liquidity Distribution")
-            fig.update_layout(xaxis_title="Liquidity", yaxis_title="Count")
-            st.plotly_chart(fig, use_container_width=True)
-    
-    # Tables
-    st.subheader("🏊 Recent Pools")
-    if not pools_df.empty:
-        display_pools = pools_df.head(10)[['address', 'fee', 'current_liquidity', 'is_tradeable', 'discovered_at']]
-        display_pools['current_liquidity'] = display_pools['current_liquidity'].apply(lambda x: f"{x:,}")
-        st.dataframe(display_pools, use_container_width=True)
-    
-    st.subheader("📧 Recent Notifications")
-    if not notifications_df.empty:
-        display_notifications = notifications_df.head(10)[['pool_address', 'notification_type', 'success', 'sent_at']]
-        st.dataframe(display_notifications, use_container_width=True)
-    
-    # Auto-refresh
+    # Sidebar controls (read before the live section so run_every is known)
     st.sidebar.button("🔄 Refresh Data")
     auto_refresh = st.sidebar.checkbox("Auto Refresh (30s)")
-    
-    if auto_refresh:
-        import time
-        time.sleep(30)
-        st.experimental_rerun()
+
+    @st.fragment(run_every=30 if auto_refresh else None)
+    def _live_section():
+        """Data-driven portion of the page - reruns alone on auto-refresh"""
+        mtime = _db_mtime()
+        listener_counts = _load_listener_counts(mtime)
+        if listener_counts is not None:
+            n_pools, n_tradeable, n_notifications = listener_counts
+            avg_liquidity = _load_metrics(mtime)[2]
+        else:
+            n_pools, n_tradeable, avg_liquidity, n_notifications = _load_metrics(mtime)
+
+        if n_pools == 0:
+            st.warning("No data available. Make sure the Enhanced Pool Listener is running.")
+            return
+
+        # Derived display objects survive widget-toggle reruns in
+        # session_state; rebuild them only when the DB file has changed
+        if st.session_state.get('data_mtime') != mtime:
+            st.session_state['data_mtime'] = mtime
+            st.session_state.pop('fig_timeline', None)
+            st.session_state.pop('fig_hist', None)
+            st.session_state.pop('pools_head', None)
+
+        # Metrics row - served entirely from the aggregate query
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("Total Pools", n_pools)
+
+        with col2:
+            st.metric("Tradeable Pools", int(n_tradeable))
+
+        with col3:
+            st.metric("Notifications Sent", n_notifications)
+
+        with col4:
+            st.metric("Avg Liquidity", f"{avg_liquidity:,.0f}")
+
+        st.markdown("---")
+
+        # Charts
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("📈 Pool Discovery Timeline")
+            daily_pools_df = _load_daily_pools(mtime)
+            if not daily_pools_df.empty:
+                if 'fig_timeline' not in st.session_state:
+                    # Plotly import costs hundreds of ms; defer until a chart is drawn
+                    import plotly.express as px
+                    fig = px.line(daily_pools_df, x='day', y='n',
+                                 title="Pools Discovered Per Day")
+                    fig.update_layout(xaxis_title="Date", yaxis_title="Pools")
+                    st.session_state['fig_timeline'] = fig
+                st.plotly_chart(st.session_state['fig_timeline'], use_container_width=True)
+
+        with col2:
+            st.subheader("💰 Liquidity Distribution")
+            if 'fig_hist' not in st.session_state:
+                import plotly.graph_objects as go
+                counts, edges = _liquidity_histogram(mtime)
+                fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts,
+                                       width=np.diff(edges)))
+                fig.update_layout(title="Pool Liquidity Distribution",
+                                  xaxis_title="Liquidity", yaxis_title="Count")
+                st.session_state['fig_hist'] = fig
+            st.plotly_chart(st.session_state['fig_hist'], use_container_width=True)
+
+        # Tables - the bulk reads only happen when a section is expanded
+        with st.expander("🏊 Recent Pools", expanded=True):
+            if 'pools_head' not in st.session_state:
+                pools_df = _load_pools(mtime)
+                st.session_state['pools_head'] = pools_df.head(10)[
+                    ['address', 'fee', 'current_liquidity', 'is_tradeable', 'discovered_at']]
+            st.dataframe(st.session_state['pools_head'].style.format({'current_liquidity': '{:,.0f}'}),
+                         use_container_width=True)
+
+        with st.expander("📧 Recent Notifications", expanded=True):
+            notifications_df = _load_notifications(mtime)
+            if not notifications_df.empty:
+                display_notifications = notifications_df.head(10)[['pool_address', 'notification_type', 'success', 'sent_at']]
+                st.dataframe(display_notifications, use_container_width=True)
+
+    _live_section()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
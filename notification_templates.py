@@ -5,13 +5,813 @@ Professional-Grade Notification Templates
 - Consistent branding and emoji strategy
 """
 
-from datetime import datetime
-import json
-from typing import Dict, Any
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+import re
+from string import Formatter
+import sys
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+# Shared embed subdicts - constant across calls and never mutated after
+# serialization, so every embed can reference the same objects
+_THUMBNAIL = {
+    "url": sys.intern("https://raw.githubusercontent.com/Uniswap/assets/master/blockchains/ethereum/assets/0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984/logo.png")
+}
+_FOOTER_ICON = sys.intern("https://raw.githubusercontent.com/ethereum/ethereum-org-website/dev/src/assets/assets/eth-diamond-purple.png")
+
+@lru_cache(maxsize=8)
+def _embed_footer(token_symbol: str, tradeable: bool) -> dict:
+    """Footer dict shared across embeds for a given token symbol"""
+    text = f"Enhanced Pool Listener • {token_symbol} Monitor"
+    if tradeable:
+        text += " • Time to trade!"
+    return {"text": text, "icon_url": _FOOTER_ICON}
+
+# Constant embed field names, interned so repeated serialization of the
+# same keys compares by pointer rather than re-hashing (CPython only
+# auto-interns identifier-like literals, not these emoji-prefixed ones)
+_NAME_POOL_ADDR = sys.intern("🎯 Pool Address")
+_NAME_TOKEN_PAIR = sys.intern("🪙 Token Pair")
+_NAME_FEE_TIER = sys.intern("💸 Fee Tier")
+_NAME_LIQUIDITY = sys.intern("💰 Current Liquidity")
+_NAME_QUICK_ACTIONS = sys.intern("🔗 Quick Actions")
+
+# Embeds are built as slotted dataclasses - lighter than a tree of dicts
+# (no hash table per node) - and only flattened to the wire dict when a
+# payload is actually shipped
+
+@dataclass(frozen=True, slots=True)
+class EmbedField:
+    """One field of a Discord embed"""
+    name: str
+    value: str
+    inline: bool = False
+
+@dataclass(frozen=True, slots=True)
+class Embed:
+    """A Discord embed; to_payload() produces the webhook wire format"""
+    title: str
+    description: str
+    color: int
+    timestamp: str
+    thumbnail: dict[str, Any]
+    fields: tuple
+    footer: dict[str, Any]
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "embeds": [{
+                "title": self.title,
+                "description": self.description,
+                "color": self.color,
+                "timestamp": self.timestamp,
+                "thumbnail": self.thumbnail,
+                "fields": [
+                    {"name": f.name, "value": f.value, "inline": f.inline}
+                    for f in self.fields
+                ],
+                "footer": self.footer,
+            }]
+        }
+
+# Hot-path emoji and color constants. The COLORS/EMOJIS class dicts stay
+# for callers that want the full catalog; the embed builders bind these
+# directly and skip the attribute + dict lookup per value.
+_FIRE = "🔥"
+_DIAMOND = "💎"
+_ROCKET = "🚀"
+_TROPHY = "🏆"
+_LIGHTNING = "⚡"
+_COLOR_MONITORING = 0x3498DB
+_COLOR_SUCCESS = 0x00FF88
+
+# Everything about the email liquidity section that flips with
+# tradeability, precomputed for both states - a single _LIQ_STATES[flag]
+# index replaces a row of `x if is_tradeable else y` ternaries
+@dataclass(frozen=True, slots=True)
+class _LiqState:
+    bg: str
+    border: str
+    fg: str
+    banner: str
+
+_LIQ_STATES = (
+    _LiqState('#fff3cd', '#ffeaa7', '#856404',
+              '⚠️ Below threshold ({threshold}). Will monitor for increases.'),
+    _LiqState('#d4edda', '#c3e6cb', '#155724',
+              '🔥 TRADEABLE! Pool has sufficient liquidity.'),
+)
+
+# Fully rendered emails, LRU-capped and keyed on (pool, type, liquidity
+# bucket, symbol). Liquidity is bucketed so near-equal values share an
+# entry; a hit returns the body as rendered for the bucket's first value.
+_RENDER_CACHE: OrderedDict = OrderedDict()
+_RENDER_CACHE_MAX = 256
+_LIQ_BUCKET = 10 ** 6
+
+# Static email skeletons, built once at import and minified below. Only
+# the fragments with format holes are re-rendered per notification; the
+# CSS constants are joined in untouched.
+
+_HTML_TAG_GAP = re.compile(r'>\s+<')
+_CSS_WS = re.compile(r'\s+')
+
+def _minify_html(fragment: str) -> str:
+    """Collapse the indentation between tags - rendering is unaffected"""
+    return _HTML_TAG_GAP.sub('><', fragment).strip()
+
+def _minify_css(fragment: str) -> str:
+    """Collapse whitespace runs in CSS to single spaces"""
+    return _CSS_WS.sub(' ', fragment).strip()
+
+_CREATED_EMAIL_HEAD_FMT = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{subject}</title>
+"""
+
+_CREATED_EMAIL_CSS_PRE = """\
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 600px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f8fafc;
+        }
+        .container {
+            background: white;
+            border-radius: 12px;
+            padding: 30px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .header {
+            text-align: center;
+            padding-bottom: 30px;
+            border-bottom: 2px solid #e2e8f0;
+        }
+        .header h1 {
+            color: #3498db;
+            font-size: 28px;
+            margin: 0;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            gap: 10px;
+        }
+        .status-badge {
+            background: #3498db;
+            color: white;
+            padding: 8px 16px;
+            border-radius: 20px;
+            font-weight: bold;
+            font-size: 14px;
+            display: inline-block;
+            margin: 10px 0;
+        }
+        .info-grid {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 20px;
+            margin: 25px 0;
+        }
+        .info-card {
+            background: #f8fafc;
+            padding: 20px;
+            border-radius: 8px;
+            border-left: 4px solid #3498db;
+        }
+        .info-card h3 {
+            margin: 0 0 10px 0;
+            color: #2c3e50;
+            font-size: 16px;
+        }
+        .info-card p {
+            margin: 0;
+            font-family: monospace;
+            font-size: 14px;
+            background: white;
+            padding: 8px;
+            border-radius: 4px;
+            word-break: break-all;
+        }
+"""
+
+_CREATED_EMAIL_CSS_LIQ_FMT = """\
+        .liquidity-section {{
+            background: {bg};
+            border: 1px solid {border};
+            border-radius: 8px;
+            padding: 20px;
+            margin: 20px 0;
+            text-align: center;
+        }}
+        .liquidity-section h3 {{
+            color: {fg};
+            margin: 0 0 10px 0;
+        }}
+"""
+
+_CREATED_EMAIL_CSS_POST = """\
+        .cta-section {
+            background: #2c3e50;
+            color: white;
+            padding: 25px;
+            border-radius: 8px;
+            text-align: center;
+            margin: 25px 0;
+        }
+        .cta-button {
+            display: inline-block;
+            background: #3498db;
+            color: white;
+            padding: 12px 25px;
+            text-decoration: none;
+            border-radius: 6px;
+            font-weight: bold;
+            margin: 5px;
+            transition: background 0.3s;
+        }
+        .cta-button:hover {
+            background: #2980b9;
+        }
+        .footer {
+            text-align: center;
+            color: #7f8c8d;
+            font-size: 12px;
+            margin-top: 30px;
+            padding-top: 20px;
+            border-top: 1px solid #e2e8f0;
+        }
+        @media (max-width: 500px) {
+            .info-grid {
+                grid-template-columns: 1fr;
+            }
+        }
+    </style>
+</head>
+"""
+
+_CREATED_EMAIL_BODY_FMT = """\
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🔍 {token_symbol} Pool Discovered</h1>
+            <div class="status-badge">NOW MONITORING</div>
+            <p style="color: #7f8c8d; margin: 10px 0;">{timestamp}</p>
+        </div>
+
+        <div class="info-grid">
+            <div class="info-card">
+                <h3>🎯 Pool Address</h3>
+                <p>{pool_address}</p>
+            </div>
+            <div class="info-card">
+                <h3>💸 Fee Tier</h3>
+                <p>{fee_pct}% ({fee} basis points)</p>
+            </div>
+            <div class="info-card">
+                <h3>🪙 Token A</h3>
+                <p>{token0}</p>
+            </div>
+            <div class="info-card">
+                <h3>🪙 Token B</h3>
+                <p>{token1}</p>
+            </div>
+        </div>
+
+        <div class="liquidity-section">
+            <h3>💰 Current Liquidity Status</h3>
+            <p style="font-size: 24px; font-weight: bold; margin: 10px 0;">
+                {liquidity}
+            </p>
+            <p style="font-size: 16px;">
+                {liquidity_status}
+            </p>
+        </div>
+
+        <div class="cta-section">
+            <h3>🔗 Quick Actions</h3>
+            <p style="margin-bottom: 20px;">Ready to explore this pool?</p>
+            <a href="https://etherscan.io/address/{pool_address}" class="cta-button">📊 View on Etherscan</a>
+            <a href="https://app.uniswap.org/#/pool/{pool_address}" class="cta-button">🏊 Uniswap Pool</a>
+            <a href="https://app.uniswap.org/#/swap?inputCurrency=ETH&outputCurrency={token_address}" class="cta-button">🔄 Trade Now</a>
+        </div>
+
+        <div class="footer">
+            <p><strong>Enhanced Pool Listener</strong> • {token_symbol} Monitor</p>
+            <p>Automated crypto pool monitoring with real-time notifications</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+_TRADEABLE_EMAIL_HEAD_FMT = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{subject}</title>
+"""
+
+_TRADEABLE_EMAIL_CSS = """\
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 600px;
+            margin: 0 auto;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }
+        .container {
+            background: white;
+            border-radius: 12px;
+            padding: 30px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+        }
+        .header {
+            text-align: center;
+            padding-bottom: 30px;
+            border-bottom: 2px solid #e2e8f0;
+        }
+        .header h1 {
+            color: #27ae60;
+            font-size: 32px;
+            margin: 0;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            gap: 10px;
+        }
+        .status-badge {
+            background: linear-gradient(135deg, #00c851, #007e33);
+            color: white;
+            padding: 12px 24px;
+            border-radius: 25px;
+            font-weight: bold;
+            font-size: 16px;
+            display: inline-block;
+            margin: 15px 0;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            animation: pulse 2s infinite;
+        }
+        @keyframes pulse {
+            0% { transform: scale(1); }
+            50% { transform: scale(1.05); }
+            100% { transform: scale(1); }
+        }
+        .alert-banner {
+            background: linear-gradient(135deg, #ff6b6b, #ee5a52);
+            color: white;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            margin: 20px 0;
+            font-size: 18px;
+            font-weight: bold;
+        }
+        .liquidity-highlight {
+            background: linear-gradient(135deg, #4ecdc4, #44a08d);
+            color: white;
+            padding: 30px;
+            border-radius: 12px;
+            text-align: center;
+            margin: 25px 0;
+            box-shadow: 0 4px 15px rgba(78, 205, 196, 0.3);
+        }
+        .liquidity-highlight h3 {
+            margin: 0 0 15px 0;
+            font-size: 24px;
+        }
+        .liquidity-amount {
+            font-size: 36px;
+            font-weight: bold;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+        }
+        .info-grid {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 20px;
+            margin: 25px 0;
+        }
+        .info-card {
+            background: #f8fafc;
+            padding: 20px;
+            border-radius: 8px;
+            border-left: 4px solid #27ae60;
+        }
+        .info-card h3 {
+            margin: 0 0 10px 0;
+            color: #2c3e50;
+            font-size: 16px;
+        }
+        .info-card p {
+            margin: 0;
+            font-family: monospace;
+            font-size: 14px;
+            background: white;
+            padding: 8px;
+            border-radius: 4px;
+            word-break: break-all;
+        }
+        .cta-section {
+            background: linear-gradient(135deg, #2c3e50, #3498db);
+            color: white;
+            padding: 30px;
+            border-radius: 12px;
+            text-align: center;
+            margin: 25px 0;
+        }
+        .cta-button {
+            display: inline-block;
+            background: linear-gradient(135deg, #e74c3c, #c0392b);
+            color: white;
+            padding: 15px 30px;
+            text-decoration: none;
+            border-radius: 8px;
+            font-weight: bold;
+            font-size: 16px;
+            margin: 8px;
+            transition: all 0.3s;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+        .cta-button:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 5px 15px rgba(231, 76, 60, 0.4);
+        }
+        .footer {
+            text-align: center;
+            color: #7f8c8d;
+            font-size: 12px;
+            margin-top: 30px;
+            padding-top: 20px;
+            border-top: 1px solid #e2e8f0;
+        }
+    </style>
+</head>
+"""
+
+_TRADEABLE_EMAIL_BODY_FMT = """\
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🚀 {token_symbol} TRADEABLE!</h1>
+            <div class="status-badge">🔥 READY TO TRADE 🔥</div>
+            <p style="color: #7f8c8d; margin: 10px 0;">{timestamp}</p>
+        </div>
+
+        <div class="alert-banner">
+            🏆 TRADING ALERT: {token_symbol} now has sufficient liquidity! 🏆
+        </div>
+
+        <div class="liquidity-highlight">
+            <h3>💰 Pool Liquidity</h3>
+            <div class="liquidity-amount">{liquidity}</div>
+            <p style="margin: 15px 0 0 0; font-size: 16px;">Pool is now actively tradeable!</p>
+        </div>
+
+        <div class="info-grid">
+            <div class="info-card">
+                <h3>🎯 Pool Address</h3>
+                <p>{pool_address}</p>
+            </div>
+            <div class="info-card">
+                <h3>💸 Fee Tier</h3>
+                <p>{fee_pct}% ({fee} basis points)</p>
+            </div>
+            <div class="info-card">
+                <h3>🪙 Token A</h3>
+                <p>{token0}</p>
+            </div>
+            <div class="info-card">
+                <h3>🪙 Token B</h3>
+                <p>{token1}</p>
+            </div>
+        </div>
+
+        <div class="cta-section">
+            <h3>⚡ TRADE NOW - DON'T MISS OUT!</h3>
+            <p style="margin-bottom: 25px; font-size: 18px;">The pool is ready - start trading immediately!</p>
+            <a href="https://app.uniswap.org/#/swap?inputCurrency=ETH&outputCurrency={token_address}" class="cta-button">🔥 INSTANT TRADE</a>
+            <a href="https://app.uniswap.org/#/pool/{pool_address}" class="cta-button">📊 Pool Analytics</a>
+            <a href="https://etherscan.io/address/{pool_address}" class="cta-button">🔍 Etherscan</a>
+        </div>
+
+        <div class="footer">
+            <p><strong>Enhanced Pool Listener</strong> • {token_symbol} Monitor</p>
+            <p>⚡ Ultra-fast crypto pool monitoring with instant notifications</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# One-shot minification at import. The 12-space template indentation is
+# pure bytes-over-wire: stripping it here shaves roughly a third off
+# every email body shipped through SMTP.
+_CREATED_EMAIL_HEAD_FMT = _minify_html(_CREATED_EMAIL_HEAD_FMT)
+_CREATED_EMAIL_CSS_PRE = _minify_css(_CREATED_EMAIL_CSS_PRE)
+_CREATED_EMAIL_CSS_LIQ_FMT = _minify_css(_CREATED_EMAIL_CSS_LIQ_FMT)
+_CREATED_EMAIL_CSS_POST = _minify_css(_CREATED_EMAIL_CSS_POST)
+_CREATED_EMAIL_BODY_FMT = _minify_html(_CREATED_EMAIL_BODY_FMT)
+_TRADEABLE_EMAIL_HEAD_FMT = _minify_html(_TRADEABLE_EMAIL_HEAD_FMT)
+_TRADEABLE_EMAIL_CSS = _minify_css(_TRADEABLE_EMAIL_CSS)
+_TRADEABLE_EMAIL_BODY_FMT = _minify_html(_TRADEABLE_EMAIL_BODY_FMT)
+
+def _compile_template(fmt: str) -> tuple:
+    """Precompile a format string into (literal bytes, field names)
+
+    The format-string parse happens once here at import; rendering is
+    then a plain interleave + b''.join with no per-call parsing, the same
+    parse-once property a compiled template engine would give.
+    """
+    literals, names = [], []
+    for literal, name, _spec, _conv in Formatter().parse(fmt):
+        literals.append(literal.encode('utf-8'))
+        names.append(name)
+    return tuple(literals), tuple(names)
+
+def _render_body(prefix: bytes, compiled: tuple, ctx: dict) -> bytes:
+    """Render a compiled body template against ctx, appended to prefix"""
+    literals, names = compiled
+    parts = [prefix]
+    for literal, name in zip(literals, names):
+        parts.append(literal)
+        if name is not None:
+            parts.append(str(ctx[name]).encode('utf-8'))
+    return b"".join(parts)
+
+_CREATED_EMAIL_BODY_TMPL = _compile_template(_CREATED_EMAIL_BODY_FMT)
+_TRADEABLE_EMAIL_BODY_TMPL = _compile_template(_TRADEABLE_EMAIL_BODY_FMT)
+
+@lru_cache(maxsize=1024)
+def _fmt_int(n: int) -> str:
+    """Comma-grouped integer, cached - the same liquidity values repeat
+    across consecutive monitor cycles, and the threshold never changes"""
+    return format(n, ",")
+
+@lru_cache(maxsize=2)
+def _fmt_ts(minute_bucket: int) -> tuple:
+    """(isoformat, pretty) timestamps at minute granularity
+
+    The displayed timestamps are minute-granular anyway, so cache the
+    strftime passes per minute instead of paying them on every
+    notification. time.gmtime skips building a datetime object entirely,
+    which also drops the module's datetime import.
+    """
+    now = time.gmtime(minute_bucket * 60)
+    return (time.strftime("%Y-%m-%dT%H:%M:%S", now),
+            time.strftime("%B %d, %Y at %I:%M %p UTC", now))
+
+@lru_cache(maxsize=8)
+def _created_email_skeleton(token_symbol, min_liquidity_threshold, is_tradeable):
+    """Subject, rendered head/CSS, and status line for a pool-created email
+
+    Everything here depends only on settings plus the tradeable flag, so
+    across a run there are at most a couple of distinct skeletons - cache
+    them and leave only the body fields to render per notification.
+    """
+    subject = f"🔍 {token_symbol} Pool Discovered - Now Monitoring"
+    state = _LIQ_STATES[is_tradeable]
+    liquidity_status = state.banner.format(threshold=_fmt_int(min_liquidity_threshold))
+    prefix = "".join([
+        _CREATED_EMAIL_HEAD_FMT.format(subject=subject),
+        _CREATED_EMAIL_CSS_PRE,
+        _CREATED_EMAIL_CSS_LIQ_FMT.format(bg=state.bg, border=state.border, fg=state.fg),
+        _CREATED_EMAIL_CSS_POST,
+    ]).encode('utf-8')
+    return subject, prefix, liquidity_status
+
+@lru_cache(maxsize=4)
+def _tradeable_email_skeleton(token_symbol):
+    """Subject and rendered head/CSS for a liquidity-added email"""
+    subject = f"🚀 {token_symbol} NOW TRADEABLE! - High Liquidity Alert"
+    prefix = (_TRADEABLE_EMAIL_HEAD_FMT.format(subject=subject) + _TRADEABLE_EMAIL_CSS).encode('utf-8')
+    return subject, prefix
+
+def make_renderers(settings) -> tuple:
+    """Build (pool_created, liquidity_added) email renderers specialized
+    for one settings object
+
+    token_symbol, token_address and min_liquidity_threshold are fixed for
+    the life of a process, so the skeletons and the settings-derived ctx
+    entries are resolved once here; the returned closures take only the
+    per-pool arguments and share the module render cache.
+    """
+    token_symbol = settings.token_symbol
+    token_address = settings.token_address
+    threshold = settings.min_liquidity_threshold
+
+    created_skeletons = (
+        _created_email_skeleton(token_symbol, threshold, False),
+        _created_email_skeleton(token_symbol, threshold, True),
+    )
+    tradeable_subject, tradeable_prefix = _tradeable_email_skeleton(token_symbol)
+
+    def render_email_created(pool_address, token0, token1, fee, liquidity):
+        # The tradeable flag is part of the key - the bucket is far
+        # coarser than the threshold, so without it a below-threshold
+        # render would be served for a now-tradeable pool in the same
+        # bucket (wrong figure and banner)
+        key = (pool_address, "pool_created", liquidity // _LIQ_BUCKET,
+               liquidity >= threshold, token_symbol)
+        cached = _RENDER_CACHE.get(key)
+        if cached is not None:
+            _RENDER_CACHE.move_to_end(key)
+            return cached
+        subject, prefix, liquidity_status = created_skeletons[liquidity >= threshold]
+        fields = {
+            'token_symbol': token_symbol,
+            'timestamp': _fmt_ts(int(time.time()) // 60)[1],
+            'pool_address': pool_address,
+            'fee_pct': f"{fee/10000:.2f}",
+            'fee': fee,
+            'token0': token0,
+            'token1': token1,
+            'liquidity': _fmt_int(liquidity),
+            'liquidity_status': liquidity_status,
+            'token_address': token_address,
+        }
+        result = subject, _render_body(prefix, _CREATED_EMAIL_BODY_TMPL, fields)
+        _RENDER_CACHE[key] = result
+        if len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+            _RENDER_CACHE.popitem(last=False)
+        return result
+
+    def render_email_tradeable(pool_address, token0, token1, fee, liquidity):
+        key = (pool_address, "liquidity_added", liquidity // _LIQ_BUCKET,
+               liquidity >= threshold, token_symbol)
+        cached = _RENDER_CACHE.get(key)
+        if cached is not None:
+            _RENDER_CACHE.move_to_end(key)
+            return cached
+        fields = {
+            'token_symbol': token_symbol,
+            'timestamp': _fmt_ts(int(time.time()) // 60)[1],
+            'pool_address': pool_address,
+            'fee_pct': f"{fee/10000:.2f}",
+            'fee': fee,
+            'token0': token0,
+            'token1': token1,
+            'liquidity': _fmt_int(liquidity),
+            'token_address': token_address,
+        }
+        result = tradeable_subject, _render_body(tradeable_prefix, _TRADEABLE_EMAIL_BODY_TMPL, fields)
+        _RENDER_CACHE[key] = result
+        if len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+            _RENDER_CACHE.popitem(last=False)
+        return result
+
+    return render_email_created, render_email_tradeable
+
+def _get_pool_created_embed(pool_address: str, token0: str, token1: str,
+                            fee: int, liquidity: int, settings, timestamp: str) -> Embed:
+    """Rich embed for pool creation"""
+
+    is_tradeable = liquidity >= settings.min_liquidity_threshold
+    token_pair = f"**Token A:** `{token0[:6]}...{token0[-4:]}`\n**Token B:** `{token1[:6]}...{token1[-4:]}`"
+    fee_str = f"**{fee/10000:.2f}%** ({fee} basis points)"
+    liq_str = _fmt_int(liquidity)
+
+    return Embed(
+        title=f"🔍 {settings.token_symbol} Pool Discovered",
+        description="**New pool found - Now monitoring for liquidity**",
+        color=_COLOR_MONITORING,
+        timestamp=timestamp,
+        thumbnail=_THUMBNAIL,
+        fields=(
+            EmbedField(_NAME_POOL_ADDR, f"```{pool_address}```"),
+            EmbedField(_NAME_TOKEN_PAIR, token_pair, inline=True),
+            EmbedField(_NAME_FEE_TIER, fee_str, inline=True),
+            EmbedField(_NAME_LIQUIDITY, f"**{liq_str}**" + (
+                f" {_FIRE} **TRADEABLE!**" if is_tradeable
+                else f" ⚠️ *Below threshold ({_fmt_int(settings.min_liquidity_threshold)})*"
+            )),
+            EmbedField(_NAME_QUICK_ACTIONS, (
+                f"[📊 View on Etherscan](https://etherscan.io/address/{pool_address}) • "
+                f"[🏊 Uniswap Pool](https://app.uniswap.org/#/pool/{pool_address}) • "
+                f"[🔄 Trade Now](https://app.uniswap.org/#/swap?inputCurrency=ETH&outputCurrency={settings.token_address})"
+            )),
+        ),
+        footer=_embed_footer(settings.token_symbol, False),
+    )
+
+def _get_liquidity_added_embed(pool_address: str, token0: str, token1: str,
+                               fee: int, liquidity: int, settings, timestamp: str) -> Embed:
+    """Rich embed for liquidity added (tradeable)"""
+
+    token_pair = f"**Token A:** `{token0[:6]}...{token0[-4:]}`\n**Token B:** `{token1[:6]}...{token1[-4:]}`"
+    fee_str = f"**{fee/10000:.2f}%** ({fee} basis points)"
+    liq_str = _fmt_int(liquidity)
+
+    return Embed(
+        title=f"🚀 {settings.token_symbol} NOW TRADEABLE!",
+        description=f"**{_FIRE} Pool has sufficient liquidity - Ready to trade! {_DIAMOND}**",
+        color=_COLOR_SUCCESS,
+        timestamp=timestamp,
+        thumbnail=_THUMBNAIL,
+        fields=(
+            EmbedField(f"{_TROPHY} TRADING ALERT",
+                       f"**{settings.token_symbol} is now tradeable with {liq_str} liquidity!**"),
+            EmbedField(_NAME_POOL_ADDR, f"```{pool_address}```"),
+            EmbedField(_NAME_TOKEN_PAIR, token_pair, inline=True),
+            EmbedField(_NAME_FEE_TIER, fee_str, inline=True),
+            EmbedField(f"{_LIGHTNING} TRADE NOW", (
+                f"[🔥 **INSTANT TRADE**](https://app.uniswap.org/#/swap?inputCurrency=ETH&outputCurrency={settings.token_address}) • "
+                f"[📊 Pool Analytics](https://app.uniswap.org/#/pool/{pool_address}) • "
+                f"[🔍 Etherscan](https://etherscan.io/address/{pool_address})"
+            )),
+        ),
+        footer=_embed_footer(settings.token_symbol, True),
+    )
+
+def _get_pool_created_email(pool_address: str, token0: str, token1: str,
+                            fee: int, liquidity: int, settings) -> tuple:
+    """HTML email for pool creation"""
+
+    timestamp = _fmt_ts(int(time.time()) // 60)[1]
+    # One attribute load per settings field; the renderer then works
+    # off plain dict gets
+    token_symbol = settings.token_symbol
+    threshold = settings.min_liquidity_threshold
+    is_tradeable = liquidity >= threshold
+
+    subject, prefix, liquidity_status = _created_email_skeleton(
+        token_symbol, threshold, is_tradeable
+    )
+
+    fields = {
+        'token_symbol': token_symbol,
+        'timestamp': timestamp,
+        'pool_address': pool_address,
+        'fee_pct': f"{fee/10000:.2f}",
+        'fee': fee,
+        'token0': token0,
+        'token1': token1,
+        'liquidity': _fmt_int(liquidity),
+        'liquidity_status': liquidity_status,
+        'token_address': settings.token_address,
+    }
+    html = _render_body(prefix, _CREATED_EMAIL_BODY_TMPL, fields)
+
+    return subject, html
+
+def _get_liquidity_added_email(pool_address: str, token0: str, token1: str,
+                               fee: int, liquidity: int, settings) -> tuple:
+    """HTML email for liquidity added (tradeable)"""
+
+    timestamp = _fmt_ts(int(time.time()) // 60)[1]
+    token_symbol = settings.token_symbol
+
+    subject, prefix = _tradeable_email_skeleton(token_symbol)
+
+    fields = {
+        'token_symbol': token_symbol,
+        'timestamp': timestamp,
+        'pool_address': pool_address,
+        'fee_pct': f"{fee/10000:.2f}",
+        'fee': fee,
+        'token0': token0,
+        'token1': token1,
+        'liquidity': _fmt_int(liquidity),
+        'token_address': settings.token_address,
+    }
+    html = _render_body(prefix, _TRADEABLE_EMAIL_BODY_TMPL, fields)
+
+    return subject, html
+
+# Dispatch tables, resolved once at import - unknown types fall back to
+# the liquidity_added builders, matching the old else branch
+_EMBED_DISPATCH = {
+    "pool_created": _get_pool_created_embed,
+    "liquidity_added": _get_liquidity_added_embed,
+}
+_EMAIL_DISPATCH = {
+    "pool_created": _get_pool_created_email,
+    "liquidity_added": _get_liquidity_added_email,
+}
 
 class NotificationTemplates:
     """Professional notification templates for Pool Listener"""
-    
+
     # Brand Colors (Professional Trading Theme)
     COLORS = {
         'success': 0x00FF88,      # Bright Green - Trading Success
@@ -20,7 +820,7 @@ class NotificationTemplates:
         'error': 0xE74C3C,        # Red - Error
         'info': 0x9B59B6         # Purple - Information
     }
-    
+
     # Emoji Strategy
     EMOJIS = {
         'pool_created': '🔍',
@@ -34,540 +834,44 @@ class NotificationTemplates:
         'lightning': '⚡',
         'trophy': '🏆'
     }
-    
+
     @staticmethod
-    def get_discord_embed(pool_address: str, token0: str, token1: str, fee: int, 
-                         liquidity: int, notification_type: str, settings) -> Dict[str, Any]:
+    def get_discord_embed(pool_address: str, token0: str, token1: str, fee: int,
+                         liquidity: int, notification_type: str, settings) -> dict[str, Any]:
         """Create rich Discord embed"""
-        
-        timestamp = datetime.now().isoformat()
-        
-        if notification_type == "pool_created":
-            return NotificationTemplates._get_pool_created_embed(
-                pool_address, token0, token1, fee, liquidity, settings, timestamp
-            )
-        else:  # liquidity_added
-            return NotificationTemplates._get_liquidity_added_embed(
-                pool_address, token0, token1, fee, liquidity, settings, timestamp
-            )
-    
-    @staticmethod
-    def _get_pool_created_embed(pool_address: str, token0: str, token1: str, 
-                               fee: int, liquidity: int, settings, timestamp: str) -> Dict[str, Any]:
-        """Rich embed for pool creation"""
-        
-        is_tradeable = liquidity >= settings.min_liquidity_threshold
-        
-        return {
-            "embeds": [{
-                "title": f"🔍 {settings.token_symbol} Pool Discovered",
-                "description": f"**New pool found - Now monitoring for liquidity**",
-                "color": NotificationTemplates.COLORS['monitoring'],
-                "timestamp": timestamp,
-                "thumbnail": {
-                    "url": "https://raw.githubusercontent.com/Uniswap/assets/master/blockchains/ethereum/assets/0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984/logo.png"
-                },
-                "fields": [
-                    {
-                        "name": "🎯 Pool Address",
-                        "value": f"```{pool_address}```",
-                        "inline": False
-                    },
-                    {
-                        "name": "🪙 Token Pair",
-                        "value": f"**Token A:** `{token0[:6]}...{token0[-4:]}`\n**Token B:** `{token1[:6]}...{token1[-4:]}`",
-                        "inline": True
-                    },
-                    {
-                        "name": "💸 Fee Tier",
-                        "value": f"**{fee/10000:.2f}%** ({fee} basis points)",
-                        "inline": True
-                    },
-                    {
-                        "name": "💰 Current Liquidity",
-                        "value": f"**{liquidity:,}**" + (
-                            f" {NotificationTemplates.EMOJIS['fire']} **TRADEABLE!**" if is_tradeable 
-                            else f" ⚠️ *Below threshold ({settings.min_liquidity_threshold:,})*"
-                        ),
-                        "inline": False
-                    },
-                    {
-                        "name": "🔗 Quick Actions",
-                        "value": (
-                            f"[📊 View on Etherscan](https://etherscan.io/address/{pool_address}) • "
-                            f"[🏊 Uniswap Pool](https://app.uniswap.org/#/pool/{pool_address}) • "
-                            f"[🔄 Trade Now](https://app.uniswap.org/#/swap?inputCurrency=ETH&outputCurrency={settings.token_address})"
-                        ),
-                        "inline": False
-                    }
-                ],
-                "footer": {
-                    "text": f"Enhanced Pool Listener • {settings.token_symbol} Monitor",
-                    "icon_url": "https://raw.githubusercontent.com/ethereum/ethereum-org-website/dev/src/assets/assets/eth-diamond-purple.png"
-                }
-            }]
-        }
-    
-    @staticmethod
-    def _get_liquidity_added_embed(pool_address: str, token0: str, token1: str, 
-                                  fee: int, liquidity: int, settings, timestamp: str) -> Dict[str, Any]:
-        """Rich embed for liquidity added (tradeable)"""
-        
-        return {
-            "embeds": [{
-                "title": f"🚀 {settings.token_symbol} NOW TRADEABLE!",
-                "description": f"**{NotificationTemplates.EMOJIS['fire']} Pool has sufficient liquidity - Ready to trade! {NotificationTemplates.EMOJIS['diamond']}**",
-                "color": NotificationTemplates.COLORS['success'],
-                "timestamp": timestamp,
-                "thumbnail": {
-                    "url": "https://raw.githubusercontent.com/Uniswap/assets/master/blockchains/ethereum/assets/0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984/logo.png"
-                },
-                "fields": [
-                    {
-                        "name": f"{NotificationTemplates.EMOJIS['trophy']} TRADING ALERT",
-                        "value": f"**{settings.token_symbol} is now tradeable with {liquidity:,} liquidity!**",
-                        "inline": False
-                    },
-                    {
-                        "name": "🎯 Pool Address",
-                        "value": f"```{pool_address}```",
-                        "inline": False
-                    },
-                    {
-                        "name": "🪙 Token Pair",
-                        "value": f"**Token A:** `{token0[:6]}...{token0[-4:]}`\n**Token B:** `{token1[:6]}...{token1[-4:]}`",
-                        "inline": True
-                    },
-                    {
-                        "name": "💸 Fee Tier",
-                        "value": f"**{fee/10000:.2f}%** ({fee} basis points)",
-                        "inline": True
-                    },
-                    {
-                        "name": f"{NotificationTemplates.EMOJIS['lightning']} TRADE NOW",
-                        "value": (
-                            f"[🔥 **INSTANT TRADE**](https://app.uniswap.org/#/swap?inputCurrency=ETH&outputCurrency={settings.token_address}) • "
-                            f"[📊 Pool Analytics](https://app.uniswap.org/#/pool/{pool_address}) • "
-                            f"[🔍 Etherscan](https://etherscan.io/address/{pool_address})"
-                        ),
-                        "inline": False
-                    }
-                ],
-                "footer": {
-                    "text": f"Enhanced Pool Listener • {settings.token_symbol} Monitor • Time to trade!",
-                    "icon_url": "https://raw.githubusercontent.com/ethereum/ethereum-org-website/dev/src/assets/assets/eth-diamond-purple.png"
-                }
-            }]
-        }
-    
+
+        timestamp = _fmt_ts(int(time.time()) // 60)[0]
+        builder = _EMBED_DISPATCH.get(notification_type, _get_liquidity_added_embed)
+        return builder(pool_address, token0, token1, fee, liquidity, settings, timestamp).to_payload()
+
     @staticmethod
-    def get_email_html(pool_address: str, token0: str, token1: str, fee: int, 
+    def get_email_html(pool_address: str, token0: str, token1: str, fee: int,
                       liquidity: int, notification_type: str, settings) -> tuple:
-        """Create beautiful HTML email"""
-        
-        if notification_type == "pool_created":
-            return NotificationTemplates._get_pool_created_email(
-                pool_address, token0, token1, fee, liquidity, settings
-            )
-        else:  # liquidity_added
-            return NotificationTemplates._get_liquidity_added_email(
-                pool_address, token0, token1, fee, liquidity, settings
-            )
-    
-    @staticmethod
-    def _get_pool_created_email(pool_address: str, token0: str, token1: str, 
-                               fee: int, liquidity: int, settings) -> tuple:
-        """HTML email for pool creation"""
-        
-        timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p UTC")
-        is_tradeable = liquidity >= settings.min_liquidity_threshold
-        
-        subject = f"🔍 {settings.token_symbol} Pool Discovered - Now Monitoring"
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{subject}</title>
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 600px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background-color: #f8fafc;
-                }}
-                .container {{
-                    background: white;
-                    border-radius: 12px;
-                    padding: 30px;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                }}
-                .header {{
-                    text-align: center;
-                    padding-bottom: 30px;
-                    border-bottom: 2px solid #e2e8f0;
-                }}
-                .header h1 {{
-                    color: #3498db;
-                    font-size: 28px;
-                    margin: 0;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    gap: 10px;
-                }}
-                .status-badge {{
-                    background: #3498db;
-                    color: white;
-                    padding: 8px 16px;
-                    border-radius: 20px;
-                    font-weight: bold;
-                    font-size: 14px;
-                    display: inline-block;
-                    margin: 10px 0;
-                }}
-                .info-grid {{
-                    display: grid;
-                    grid-template-columns: 1fr 1fr;
-                    gap: 20px;
-                    margin: 25px 0;
-                }}
-                .info-card {{
-                    background: #f8fafc;
-                    padding: 20px;
-                    border-radius: 8px;
-                    border-left: 4px solid #3498db;
-                }}
-                .info-card h3 {{
-                    margin: 0 0 10px 0;
-                    color: #2c3e50;
-                    font-size: 16px;
-                }}
-                .info-card p {{
-                    margin: 0;
-                    font-family: monospace;
-                    font-size: 14px;
-                    background: white;
-                    padding: 8px;
-                    border-radius: 4px;
-                    word-break: break-all;
-                }}
-                .liquidity-section {{
-                    background: {'#d4edda' if is_tradeable else '#fff3cd'};
-                    border: 1px solid {'#c3e6cb' if is_tradeable else '#ffeaa7'};
-                    border-radius: 8px;
-                    padding: 20px;
-                    margin: 20px 0;
-                    text-align: center;
-                }}
-                .liquidity-section h3 {{
-                    color: {'#155724' if is_tradeable else '#856404'};
-                    margin: 0 0 10px 0;
-                }}
-                .cta-section {{
-                    background: #2c3e50;
-                    color: white;
-                    padding: 25px;
-                    border-radius: 8px;
-                    text-align: center;
-                    margin: 25px 0;
-                }}
-                .cta-button {{
-                    display: inline-block;
-                    background: #3498db;
-                    color: white;
-                    padding: 12px 25px;
-                    text-decoration: none;
-                    border-radius: 6px;
-                    font-weight: bold;
-                    margin: 5px;
-                    transition: background 0.3s;
-                }}
-                .cta-button:hover {{
-                    background: #2980b9;
-                }}
-                .footer {{
-                    text-align: center;
-                    color: #7f8c8d;
-                    font-size: 12px;
-                    margin-top: 30px;
-                    padding-top: 20px;
-                    border-top: 1px solid #e2e8f0;
-                }}
-                @media (max-width: 500px) {{
-                    .info-grid {{
-                        grid-template-columns: 1fr;
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🔍 {settings.token_symbol} Pool Discovered</h1>
-                    <div class="status-badge">NOW MONITORING</div>
-                    <p style="color: #7f8c8d; margin: 10px 0;">{timestamp}</p>
-                </div>
-                
-                <div class="info-grid">
-                    <div class="info-card">
-                        <h3>🎯 Pool Address</h3>
-                        <p>{pool_address}</p>
-                    </div>
-                    <div class="info-card">
-                        <h3>💸 Fee Tier</h3>
-                        <p>{fee/10000:.2f}% ({fee} basis points)</p>
-                    </div>
-                    <div class="info-card">
-                        <h3>🪙 Token A</h3>
-                        <p>{token0}</p>
-                    </div>
-                    <div class="info-card">
-                        <h3>🪙 Token B</h3>
-                        <p>{token1}</p>
-                    </div>
-                </div>
-                
-                <div class="liquidity-section">
-                    <h3>💰 Current Liquidity Status</h3>
-                    <p style="font-size: 24px; font-weight: bold; margin: 10px 0;">
-                        {liquidity:,}
-                    </p>
-                    <p style="font-size: 16px;">
-                        {'🔥 TRADEABLE! Pool has sufficient liquidity.' if is_tradeable else f'⚠️ Below threshold ({settings.min_liquidity_threshold:,}). Will monitor for increases.'}
-                    </p>
-                </div>
-                
-                <div class="cta-section">
-                    <h3>🔗 Quick Actions</h3>
-                    <p style="margin-bottom: 20px;">Ready to explore this pool?</p>
-                    <a href="https://etherscan.io/address/{pool_address}" class="cta-button">📊 View on Etherscan</a>
-                    <a href="https://app.uniswap.org/#/pool/{pool_address}" class="cta-button">🏊 Uniswap Pool</a>
-                    <a href="https://app.uniswap.org/#/swap?inputCurrency=ETH&outputCurrency={settings.token_address}" class="cta-button">🔄 Trade Now</a>
-                </div>
-                
-                <div class="footer">
-                    <p><strong>Enhanced Pool Listener</strong> • {settings.token_symbol} Monitor</p>
-                    <p>Automated crypto pool monitoring with real-time notifications</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return subject, html
-    
-    @staticmethod
-    def _get_liquidity_added_email(pool_address: str, token0: str, token1: str, 
-                                  fee: int, liquidity: int, settings) -> tuple:
-        """HTML email for liquidity added (tradeable)"""
-        
-        timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p UTC")
-        
-        subject = f"🚀 {settings.token_symbol} NOW TRADEABLE! - High Liquidity Alert"
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{subject}</title>
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    line-height: 1.6;
-                    color: #333;
-                    max-width: 600px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                }}
-                .container {{
-                    background: white;
-                    border-radius: 12px;
-                    padding: 30px;
-                    box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-                }}
-                .header {{
-                    text-align: center;
-                    padding-bottom: 30px;
-                    border-bottom: 2px solid #e2e8f0;
-                }}
-                .header h1 {{
-                    color: #27ae60;
-                    font-size: 32px;
-                    margin: 0;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    gap: 10px;
-                }}
-                .status-badge {{
-                    background: linear-gradient(135deg, #00c851, #007e33);
-                    color: white;
-                    padding: 12px 24px;
-                    border-radius: 25px;
-                    font-weight: bold;
-                    font-size: 16px;
-                    display: inline-block;
-                    margin: 15px 0;
-                    text-transform: uppercase;
-                    letter-spacing: 1px;
-                    animation: pulse 2s infinite;
-                }}
-                @keyframes pulse {{
-                    0% {{ transform: scale(1); }}
-                    50% {{ transform: scale(1.05); }}
-                    100% {{ transform: scale(1); }}
-                }}
-                .alert-banner {{
-                    background: linear-gradient(135deg, #ff6b6b, #ee5a52);
-                    color: white;
-                    padding: 20px;
-                    border-radius: 8px;
-                    text-align: center;
-                    margin: 20px 0;
-                    font-size: 18px;
-                    font-weight: bold;
-                }}
-                .liquidity-highlight {{
-                    background: linear-gradient(135deg, #4ecdc4, #44a08d);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 12px;
-                    text-align: center;
-                    margin: 25px 0;
-                    box-shadow: 0 4px 15px rgba(78, 205, 196, 0.3);
-                }}
-                .liquidity-highlight h3 {{
-                    margin: 0 0 15px 0;
-                    font-size: 24px;
-                }}
-                .liquidity-amount {{
-                    font-size: 36px;
-                    font-weight: bold;
-                    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-                }}
-                .info-grid {{
-                    display: grid;
-                    grid-template-columns: 1fr 1fr;
-                    gap: 20px;
-                    margin: 25px 0;
-                }}
-                .info-card {{
-                    background: #f8fafc;
-                    padding: 20px;
-                    border-radius: 8px;
-                    border-left: 4px solid #27ae60;
-                }}
-                .info-card h3 {{
-                    margin: 0 0 10px 0;
-                    color: #2c3e50;
-                    font-size: 16px;
-                }}
-                .info-card p {{
-                    margin: 0;
-                    font-family: monospace;
-                    font-size: 14px;
-                    background: white;
-                    padding: 8px;
-                    border-radius: 4px;
-                    word-break: break-all;
-                }}
-                .cta-section {{
-                    background: linear-gradient(135deg, #2c3e50, #3498db);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 12px;
-                    text-align: center;
-                    margin: 25px 0;
-                }}
-                .cta-button {{
-                    display: inline-block;
-                    background: linear-gradient(135deg, #e74c3c, #c0392b);
-                    color: white;
-                    padding: 15px 30px;
-                    text-decoration: none;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    font-size: 16px;
-                    margin: 8px;
-                    transition: all 0.3s;
-                    text-transform: uppercase;
-                    letter-spacing: 1px;
-                }}
-                .cta-button:hover {{
-                    transform: translateY(-2px);
-                    box-shadow: 0 5px 15px rgba(231, 76, 60, 0.4);
-                }}
-                .footer {{
-                    text-align: center;
-                    color: #7f8c8d;
-                    font-size: 12px;
-                    margin-top: 30px;
-                    padding-top: 20px;
-                    border-top: 1px solid #e2e8f0;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🚀 {settings.token_symbol} TRADEABLE!</h1>
-                    <div class="status-badge">🔥 READY TO TRADE 🔥</div>
-                    <p style="color: #7f8c8d; margin: 10px 0;">{timestamp}</p>
-                </div>
-                
-                <div class="alert-banner">
-                    🏆 TRADING ALERT: {settings.token_symbol} now has sufficient liquidity! 🏆
-                </div>
-                
-                <div class="liquidity-highlight">
-                    <h3>💰 Pool Liquidity</h3>
-                    <div class="liquidity-amount">{liquidity:,}</div>
-                    <p style="margin: 15px 0 0 0; font-size: 16px;">Pool is now actively tradeable!</p>
-                </div>
-                
-                <div class="info-grid">
-                    <div class="info-card">
-                        <h3>🎯 Pool Address</h3>
-                        <p>{pool_address}</p>
-                    </div>
-                    <div class="info-card">
-                        <h3>💸 Fee Tier</h3>
-                        <p>{fee/10000:.2f}% ({fee} basis points)</p>
-                    </div>
-                    <div class="info-card">
-                        <h3>🪙 Token A</h3>
-                        <p>{token0}</p>
-                    </div>
-                    <div class="info-card">
-                        <h3>🪙 Token B</h3>
-                        <p>{token1}</p>
-                    </div>
-                </div>
-                
-                <div class="cta-section">
-                    <h3>⚡ TRADE NOW - DON'T MISS OUT!</h3>
-                    <p style="margin-bottom: 25px; font-size: 18px;">The pool is ready - start trading immediately!</p>
-                    <a href="https://app.uniswap.org/#/swap?inputCurrency=ETH&outputCurrency={settings.token_address}" class="cta-button">🔥 INSTANT TRADE</a>
-                    <a href="https://app.uniswap.org/#/pool/{pool_address}" class="cta-button">📊 Pool Analytics</a>
-                    <a href="https://etherscan.io/address/{pool_address}" class="cta-button">🔍 Etherscan</a>
-                </div>
-                
-                <div class="footer">
-                    <p><strong>Enhanced Pool Listener</strong> • {settings.token_symbol} Monitor</p>
-                    <p>⚡ Ultra-fast crypto pool monitoring with instant notifications</p>
-                </div>
-            </div>
-        </body>
-        </html>
+        """Create beautiful HTML email as (subject, UTF-8 encoded body)
+
+        Rendered emails are cached per (pool, type, liquidity bucket,
+        tradeable flag), so the repeat notifications a monitored pool
+        generates as liquidity drifts within a bucket skip rendering
+        entirely - but crossing the threshold always re-renders, since
+        the bucket is far coarser than the threshold.
         """
-        
-        return subject, html 
\ No newline at end of file
+        threshold = settings.min_liquidity_threshold
+        key = (pool_address, notification_type, liquidity // _LIQ_BUCKET,
+               liquidity >= threshold, threshold, settings.token_symbol)
+        cached = _RENDER_CACHE.get(key)
+        if cached is not None:
+            _RENDER_CACHE.move_to_end(key)
+            return cached
+
+        builder = _EMAIL_DISPATCH.get(notification_type, _get_liquidity_added_email)
+        result = builder(pool_address, token0, token1, fee, liquidity, settings)
+        _RENDER_CACHE[key] = result
+        if len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+            _RENDER_CACHE.popitem(last=False)
+        return result
+
+    # Back-compat aliases - the builders themselves live at module scope
+    _get_pool_created_embed = staticmethod(_get_pool_created_embed)
+    _get_liquidity_added_embed = staticmethod(_get_liquidity_added_embed)
+    _get_pool_created_email = staticmethod(_get_pool_created_email)
+    _get_liquidity_added_email = staticmethod(_get_liquidity_added_email)
@@ -11,17 +11,26 @@ Enhanced Pool Listener - Production Ready
 
 import time
 import json
+import heapq
+import queue
+import asyncio
 import sqlite3
 import threading
 from datetime import datetime
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
+from functools import cached_property
 from contextlib import contextmanager
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 # Core web3
 from web3 import Web3
 from web3.exceptions import Web3Exception
 
+# HTTP session for the RPC provider
+import requests
+from requests.adapters import HTTPAdapter
+
 # Retry Logic (FREE)
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import backoff
@@ -42,11 +51,13 @@ import apprise
 
 # Email and environment
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.header import Header
 from dotenv import load_dotenv
 import os
 
+# Notification templates
+from notification_templates import NotificationTemplates, make_renderers
+
 # Initialize colorama for colored console output
 colorama.init()
 
@@ -111,6 +122,7 @@ class Settings(BaseModel):
     database_path: str = "pool_listener.db"
     metrics_port: int = 8000
     max_worker_threads: int = 5
+    use_websocket: bool = False
     
     # Notification channels (apprise format)
     notification_urls: str = ""
@@ -121,9 +133,12 @@ class Settings(BaseModel):
             raise ValueError('Invalid Ethereum address format')
         return v.lower()
     
-    @property
-    def receiver_emails(self) -> List[str]:
-        return [email.strip() for email in self.receiver_email.split(',')]
+    @cached_property
+    def receiver_emails(self) -> Tuple[str, ...]:
+        # Split once into a frozen tuple - this is read on every email send
+        return tuple(
+            email.strip() for email in self.receiver_email.split(',') if email.strip()
+        )
 
 def load_settings() -> Settings:
     """Load settings from environment variables"""
@@ -143,6 +158,7 @@ def load_settings() -> Settings:
             database_path=os.getenv('DATABASE_PATH', 'pool_listener.db'),
             metrics_port=int(os.getenv('METRICS_PORT', '8000')),
             max_worker_threads=int(os.getenv('MAX_WORKER_THREADS', '5')),
+            use_websocket=os.getenv('USE_WEBSOCKET', 'false').lower() in ('1', 'true', 'yes'),
             notification_urls=os.getenv('NOTIFICATION_URLS', '')
         )
     except Exception as e:
@@ -187,18 +203,67 @@ active_pools_gauge = Gauge(
     registry=METRICS_REGISTRY
 )
 
+# Hot-path SQL, hoisted so every call reuses the identical string object
+# and hits the connection statement cache instead of re-parsing
+SQL_SAVE_POOL = '''
+    INSERT OR REPLACE INTO pools
+    (address, token0, token1, fee, current_liquidity, last_checked, is_tradeable)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+'''
+SQL_MARK_TRADEABLE = '''
+    UPDATE pools
+    SET is_tradeable = 1, current_liquidity = ?, last_checked = CURRENT_TIMESTAMP
+    WHERE address = ?
+'''
+SQL_LOG_NOTIF = '''
+    INSERT INTO notifications
+    (pool_address, notification_type, success, error_message, channels)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
 # Database Manager for SQLite
 class DatabaseManager:
     """SQLite database manager for persistent state"""
-    
+
+    # Per-connection tuning - synchronous/temp_store/mmap/cache are not
+    # stored in the database file, so every new connection replays them
+    CONNECTION_PRAGMAS = '''
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-65536;
+        PRAGMA busy_timeout=30000;
+    '''
+
+    # Notification-log batching: flush whenever this many rows are
+    # buffered or this much time has passed since the first one
+    LOG_FLUSH_BATCH = 50
+    LOG_FLUSH_INTERVAL = 1.0
+
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.init_database()
-    
+        # Persistent connection pool - connections are opened once and
+        # recycled, keeping SQLite's page cache hot across operations.
+        # LIFO so the most recently used connection is handed out next.
+        pool_size = settings.max_worker_threads + 2
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._new_connection())
+        # log_notification only enqueues; this daemon thread batches the
+        # rows into one INSERT transaction instead of one fsync per row
+        self._log_queue = queue.SimpleQueue()
+        self._log_writer = threading.Thread(target=self._drain_log_queue, daemon=True)
+        self._log_writer.start()
+
     def init_database(self):
         """Initialize database tables"""
         try:
             with sqlite3.connect(self.db_path) as conn:
+                # WAL is persistent once set; with synchronous=NORMAL it
+                # drops the per-commit fsync and lets the reader threads
+                # in check_existing_pools_parallel run alongside writes
+                conn.execute('PRAGMA journal_mode=WAL')
                 cursor = conn.cursor()
                 
                 # Pools table
@@ -229,7 +294,12 @@ class DatabaseManager:
                         channels TEXT
                     )
                 ''')
-                
+
+                # Indexes so the filtered counts in get_stats are index
+                # scans instead of full table scans
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_pools_tradeable ON pools(is_tradeable)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_notifications_success ON notifications(success)')
+
                 conn.commit()
                 logger.info(f"Database initialized: {self.db_path}")
                 
@@ -237,88 +307,98 @@ class DatabaseManager:
             logger.error(f"Database initialization error: {e}")
             raise
     
+    def _new_connection(self):
+        """Open and configure one pooled connection"""
+        conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False,
+                               cached_statements=256)
+        conn.executescript(self.CONNECTION_PRAGMAS)
+        conn.row_factory = sqlite3.Row
+        return conn
+
     @contextmanager
     def get_connection(self):
-        """Get database connection context manager"""
-        conn = None
+        """Borrow a pooled connection (returned on exit)"""
+        conn = self._pool.get()
         try:
-            conn = sqlite3.connect(self.db_path, timeout=30.0)
-            conn.row_factory = sqlite3.Row
             yield conn
             conn.commit()
         except Exception as e:
-            if conn:
-                conn.rollback()
+            conn.rollback()
             logger.error(f"Database error: {e}")
             raise
         finally:
-            if conn:
-                conn.close()
+            self._pool.put(conn)
     
     def save_pool(self, pool_data: dict):
         """Save or update pool data"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO pools 
-                (address, token0, token1, fee, current_liquidity, last_checked, is_tradeable)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            cursor.execute(SQL_SAVE_POOL, (
                 pool_data['address'],
                 pool_data['token0'], 
                 pool_data['token1'],
                 pool_data['fee'],
                 pool_data['liquidity'],
-                datetime.now(),
                 pool_data['liquidity'] >= settings.min_liquidity_threshold
             ))
     
-    def get_non_tradeable_pools(self) -> List[dict]:
-        """Get pools that aren't tradeable yet"""
+    def get_non_tradeable_pools(self) -> List[sqlite3.Row]:
+        """Get pools that aren't tradeable yet
+
+        Projects only the columns the sweep reads and returns the rows
+        as-is - sqlite3.Row supports name lookup without the per-row
+        dict() materialization.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT * FROM pools WHERE is_tradeable = 0')
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute('''
+                SELECT address, token0, token1, fee, current_liquidity, is_tradeable
+                FROM pools WHERE is_tradeable = 0
+            ''')
+            return cursor.fetchall()
     
     def mark_pool_tradeable(self, pool_address: str, liquidity: int):
         """Mark pool as tradeable"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE pools 
-                SET is_tradeable = 1, current_liquidity = ?, last_checked = ?
-                WHERE address = ?
-            ''', (liquidity, datetime.now(), pool_address))
+            cursor.execute(SQL_MARK_TRADEABLE, (liquidity, pool_address))
     
     def log_notification(self, pool_address: str, notification_type: str, success: bool, channels: str, error: str = None):
-        """Log notification attempt"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO notifications 
-                (pool_address, notification_type, success, error_message, channels)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (pool_address, notification_type, success, error, channels))
+        """Queue a notification log row (flushed in batches by the writer thread)"""
+        self._log_queue.put((pool_address, notification_type, success, error, channels))
+
+    def _drain_log_queue(self):
+        """Writer loop: collect up to LOG_FLUSH_BATCH rows (or wait
+        LOG_FLUSH_INTERVAL after the first) and insert them in one
+        executemany transaction"""
+        while True:
+            rows = [self._log_queue.get()]
+            deadline = time.monotonic() + self.LOG_FLUSH_INTERVAL
+            while len(rows) < self.LOG_FLUSH_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(self._log_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                with self.get_connection() as conn:
+                    conn.executemany(SQL_LOG_NOTIF, rows)
+            except Exception as e:
+                logger.error(f"Notification log flush failed: {e}")
     
     def get_stats(self) -> dict:
-        """Get database statistics"""
+        """Get database statistics (one aggregate roundtrip)"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) as total FROM pools')
-            total_pools = cursor.fetchone()['total']
-            
-            cursor.execute('SELECT COUNT(*) as tradeable FROM pools WHERE is_tradeable = 1')
-            tradeable_pools = cursor.fetchone()['tradeable']
-            
-            cursor.execute('SELECT COUNT(*) as notifications FROM notifications WHERE success = 1')
-            successful_notifications = cursor.fetchone()['notifications']
-            
-            return {
-                'total_pools': total_pools,
-                'tradeable_pools': tradeable_pools,
-                'successful_notifications': successful_notifications
-            }
+            cursor.execute('''
+                SELECT
+                    (SELECT COUNT(*) FROM pools) AS total_pools,
+                    (SELECT COUNT(*) FROM pools WHERE is_tradeable = 1) AS tradeable_pools,
+                    (SELECT COUNT(*) FROM notifications WHERE success = 1) AS successful_notifications
+            ''')
+            return dict(cursor.fetchone())
 
 # Initialize database
 db = DatabaseManager(settings.database_path)
@@ -332,14 +412,151 @@ db = DatabaseManager(settings.database_path)
 def create_web3_connection() -> Web3:
     """Create Web3 connection with retry logic"""
     provider_url = f'https://mainnet.infura.io/v3/{settings.infura_api_key}'
-    w3 = Web3(Web3.HTTPProvider(provider_url))
-    
-if not w3.is_connected():
+    # Keep-alive session with a connection pool sized to the worker
+    # threads - RPCs reuse established TLS connections instead of paying
+    # TCP + handshake setup per call
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=settings.max_worker_threads,
+        pool_maxsize=settings.max_worker_threads * 2,
+        max_retries=0
+    ))
+    w3 = Web3(Web3.HTTPProvider(provider_url, session=session,
+                                request_kwargs={'timeout': 10}))
+
+    if not w3.is_connected():
         raise ConnectionError("Failed to connect to Ethereum mainnet")
-    
+
     logger.info(f"Connected to Ethereum mainnet via {provider_url[:50]}...")
     return w3
 
+# Multicall3 (same address on mainnet and most L2s) - batches the
+# per-pool liquidity() eth_calls into one RPC round trip per chunk
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+MULTICALL3_ABI = [
+    {
+        "inputs": [{
+            "components": [
+                {"name": "target", "type": "address"},
+                {"name": "allowFailure", "type": "bool"},
+                {"name": "callData", "type": "bytes"}
+            ],
+            "name": "calls",
+            "type": "tuple[]"
+        }],
+        "name": "aggregate3",
+        "outputs": [{
+            "components": [
+                {"name": "success", "type": "bool"},
+                {"name": "returnData", "type": "bytes"}
+            ],
+            "name": "returnData",
+            "type": "tuple[]"
+        }],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+LIQUIDITY_SELECTOR = Web3.keccak(text='liquidity()')[:4]
+MULTICALL_CHUNK = 500  # stays well under provider gas caps
+
+# topic0 of Uniswap V3 PoolCreated, precomputed for raw eth_getLogs
+POOL_CREATED_TOPIC = '0x' + Web3.keccak(
+    text='PoolCreated(address,address,uint24,int24,address)'
+).hex().removeprefix('0x')
+
+# Target token padded to a 32-byte log topic - lets the node filter
+# PoolCreated events by token0/token1 server-side
+TARGET_TOKEN_TOPIC = '0x' + settings.token_address[2:].rjust(64, '0')
+
+# Dedup window for the websocket loop's duplicate-subscription filter
+SEEN_LOGS_MAX = 4096
+
+def _bloom_bits(item: bytes) -> tuple:
+    """The three logs-bloom bit positions for an address or topic
+
+    Per the yellow paper: keccak the item, take the low 11 bits of byte
+    pairs 0-1, 2-3 and 4-5.
+    """
+    digest = Web3.keccak(item)
+    return tuple(int.from_bytes(digest[i:i + 2], 'big') & 2047 for i in (0, 2, 4))
+
+def bloom_may_contain_pool_created(logs_bloom: bytes) -> bool:
+    """Can this block's bloom contain a PoolCreated log for our token?
+
+    False means definitively no matching log in the block, so the
+    eth_getLogs round trip can be skipped; True may be a false positive.
+    """
+    return all(
+        logs_bloom[255 - (bit >> 3)] & (1 << (bit & 7))
+        for bits in _POOL_CREATED_BLOOM_BITS for bit in bits
+    )
+
+# Uniswap V3 Factory
+FACTORY_ADDRESS = '0x1F98431c8aD98523631AE4a59f267346ea31F984'
+# Lowercased once for the cheap pre-decode address compare
+FACTORY_LC = FACTORY_ADDRESS.lower()
+FACTORY_ABI = [
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "name": "token0", "type": "address"},
+            {"indexed": True, "name": "token1", "type": "address"},
+            {"indexed": True, "name": "fee", "type": "uint24"},
+            {"indexed": False, "name": "tickSpacing", "type": "int24"},
+            {"indexed": False, "name": "pool", "type": "address"}
+        ],
+        "name": "PoolCreated",
+        "type": "event"
+    }
+]
+
+# A matching block must have the factory address, the PoolCreated topic
+# and the target-token topic all present in its logs bloom
+_POOL_CREATED_BLOOM_BITS = tuple(
+    _bloom_bits(bytes.fromhex(item[2:]))
+    for item in (FACTORY_ADDRESS, POOL_CREATED_TOPIC, TARGET_TOKEN_TOPIC)
+)
+
+def batch_check_pool_liquidity(w3: Web3, pool_addresses: List[str]) -> Dict[str, Optional[int]]:
+    """Fetch liquidity() for many pools with one aggregate3 call per chunk
+
+    Returns {address: liquidity} with None for pools whose call failed.
+    The per-pool path was network-bound on provider latency; this drops
+    N round trips to ceil(N/500), and when more than one chunk is needed
+    the aggregate3 calls go out concurrently so the sweep costs one
+    round-trip time regardless of pool count.
+    """
+    multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+    def _call_chunk(chunk):
+        calls = [(Web3.to_checksum_address(address), True, LIQUIDITY_SELECTOR)
+                 for address in chunk]
+        try:
+            return multicall.functions.aggregate3(calls).call()
+        except Exception as e:
+            logger.error(f"Multicall liquidity batch failed: {e}")
+            return [(False, b'')] * len(chunk)
+
+    chunks = [pool_addresses[start:start + MULTICALL_CHUNK]
+              for start in range(0, len(pool_addresses), MULTICALL_CHUNK)]
+    if len(chunks) <= 1:
+        returned_per_chunk = [_call_chunk(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(chunks), settings.max_worker_threads)) as executor:
+            returned_per_chunk = list(executor.map(_call_chunk, chunks))
+
+    results = {}
+    for chunk, returned in zip(chunks, returned_per_chunk):
+        for address, (success, return_data) in zip(chunk, returned):
+            if success and len(return_data) >= 32:
+                results[address] = int.from_bytes(return_data[:32], 'big')
+                liquidity_checks_total.labels(status="success").inc()
+            else:
+                results[address] = None
+                liquidity_checks_total.labels(status="error").inc()
+    return results
+
 # Enhanced retry logic for liquidity checks
 @retry(
     stop=stop_after_attempt(3),
@@ -347,25 +564,24 @@ if not w3.is_connected():
     retry=retry_if_exception_type((Web3Exception, ConnectionError))
 )
 def check_pool_liquidity_with_retry(w3: Web3, pool_address: str) -> Tuple[bool, int]:
-    """Check pool liquidity with retry logic"""
-    
-    pool_abi = [
-        {
-            "inputs": [],
-            "name": "liquidity",
-            "outputs": [{"internalType": "uint128", "name": "", "type": "uint128"}],
-            "stateMutability": "view",
-            "type": "function"
-        }
-    ]
-    
+    """Check pool liquidity with retry logic
+
+    Issues the liquidity() call as raw calldata with the precomputed
+    selector - no per-call ABI parsing or Contract object construction,
+    and the uint128 decodes straight out of the 32-byte return word.
+    """
     try:
-        pool_contract = w3.eth.contract(address=pool_address, abi=pool_abi)
-        liquidity = pool_contract.functions.liquidity().call()
+        result = w3.eth.call({
+            'to': Web3.to_checksum_address(pool_address),
+            'data': LIQUIDITY_SELECTOR
+        })
+        liquidity = int.from_bytes(result[-16:], 'big')
         has_liquidity = liquidity >= settings.min_liquidity_threshold
         
         liquidity_checks_total.labels(status="success").inc()
-        logger.debug(f"Liquidity check: {pool_address} = {liquidity:,} (tradeable: {has_liquidity})")
+        # %-style defers formatting to the handler - this line runs per
+        # pool per sweep, so skip the f-string when DEBUG is off
+        logger.debug("Liquidity check: %s = %s (tradeable: %s)", pool_address, liquidity, has_liquidity)
         return has_liquidity, liquidity
         
     except Exception as e:
@@ -380,57 +596,106 @@ class NotificationManager:
     def __init__(self):
         self.apobj = apprise.Apprise()
         self.templates = NotificationTemplates()
+        # Email renderers specialized for this deployment's settings -
+        # the closures bake in token symbol/address and threshold
+        self._email_renderers = dict(zip(
+            ("pool_created", "liquidity_added"), make_renderers(settings)
+        ))
+        # Long-lived SMTP connection - opened lazily, reused across
+        # notifications so each send skips the TLS handshake and login
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        self._to_header = ', '.join(settings.receiver_emails)
+        # Static MIME scaffold built once - per send only the Subject
+        # line and the pre-encoded template body vary, so each email is
+        # three bytes concatenations instead of a MIME tree + re-parse
+        self._email_header_blob = (
+            f"From: {settings.sender_email}\r\n"
+            f"To: {self._to_header}\r\n"
+            "MIME-Version: 1.0\r\n"
+            'Content-Type: text/html; charset="utf-8"\r\n'
+            "Content-Transfer-Encoding: 8bit\r\n"
+        ).encode('utf-8')
+        # Dispatch pool - sends run here so the event loop never blocks
+        # on SMTP/webhook latency between PoolCreated events
+        self._notify_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="notify"
+        )
         self.setup_channels()
     
     def setup_channels(self):
         """Setup notification channels"""
         
+        # Channels are tagged at add time so notification paths route by
+        # tag natively instead of re-stringifying server objects
+
         # Email notification (always enabled)
         for recipient in settings.receiver_emails:
             email_url = f"mailto://{recipient}"
-            self.apobj.add(email_url)
-        
+            self.apobj.add(email_url, tag='simple')
+
         logger.info(f"Email notifications enabled for {len(settings.receiver_emails)} recipients")
-        
+
         # Additional channels from environment
         if settings.notification_urls:
             for url in settings.notification_urls.split(','):
-                if url.strip():
+                url = url.strip()
+                if url:
                     try:
-                        self.apobj.add(url.strip())
-                        logger.info(f"Added notification channel: {url.strip()[:30]}...")
+                        self.apobj.add(url, tag='discord' if 'discord' in url.lower() else 'simple')
+                        logger.info(f"Added notification channel: {url[:30]}...")
                     except Exception as e:
-                        logger.warning(f"Failed to add notification channel {url.strip()[:30]}...: {e}")
-        
+                        logger.warning(f"Failed to add notification channel {url[:30]}...: {e}")
+
+        self.discord_servers = list(self.apobj.find(tag='discord'))
+
         logger.info(f"Total notification channels: {len(self.apobj.servers)}")
     
+    def send_notification(self, pool_address: str, token0: str, token1: str, fee: int,
+                          liquidity: int, notification_type: str):
+        """Queue a notification for background delivery
+
+        Returns the future so callers that care can wait on it; the
+        monitoring loop does not, keeping event processing hot while
+        SMTP and webhooks run on the dispatch pool.
+        """
+        return self._notify_pool.submit(
+            self._send_sync, pool_address, token0, token1, fee, liquidity, notification_type
+        )
+
+    def shutdown(self):
+        """Drain in-flight notifications before exit"""
+        self._notify_pool.shutdown(wait=True)
+        with self._smtp_lock:
+            self._close_smtp()
+
     @backoff.on_exception(backoff.expo, Exception, max_tries=3)
-    def send_notification(self, pool_address: str, token0: str, token1: str, fee: int, 
-                         liquidity: int, notification_type: str) -> dict:
+    def _send_sync(self, pool_address: str, token0: str, token1: str, fee: int,
+                   liquidity: int, notification_type: str) -> dict:
         """Send beautiful multi-channel notifications"""
         
         start_time = time.time()
         
         try:
             # Send Discord notification with rich embed
-            if any('discord' in str(server) for server in self.apobj.servers):
+            if self.discord_servers:
                 discord_embed = self.templates.get_discord_embed(
                     pool_address, token0, token1, fee, liquidity, notification_type, settings
                 )
-                
+
                 # Send to Discord with rich embed
-                for server in self.apobj.servers:
-                    if 'discord' in str(server):
-                        server.notify(
-                            title="", 
-                            body="", 
-                            **discord_embed
-                        )
+                for server in self.discord_servers:
+                    server.notify(
+                        title="",
+                        body="",
+                        **discord_embed
+                    )
             
             # Send email with beautiful HTML template
-            subject, html_body = self.templates.get_email_html(
-                pool_address, token0, token1, fee, liquidity, notification_type, settings
+            render_email = self._email_renderers.get(
+                notification_type, self._email_renderers["liquidity_added"]
             )
+            subject, html_body = render_email(pool_address, token0, token1, fee, liquidity)
             
             # Send HTML email
             self._send_html_email(subject, html_body)
@@ -442,7 +707,8 @@ class NotificationManager:
             
             success = self.apobj.notify(
                 title=subject,
-                body=simple_message
+                body=simple_message,
+                tag='simple'
             )
             
             # Record metrics
@@ -488,30 +754,59 @@ class NotificationManager:
             
             raise
     
-    def _send_html_email(self, subject: str, html_body: str):
+    def _send_html_email(self, subject: str, html_body: bytes):
         """Send beautiful HTML email"""
-        
-        msg = MIMEMultipart('alternative')
-        msg['Subject'] = subject
-        msg['From'] = settings.sender_email
-        msg['To'] = ', '.join(settings.receiver_emails)
-        
-        # Attach HTML version
-        html_part = MIMEText(html_body, 'html')
-        msg.attach(html_part)
-        
-        # Send email
+
+        # Cached header blob + RFC 2047 subject + pre-encoded body;
+        # sendmail ships the raw bytes and skips send_message's
+        # header re-parsing pass. smtplib only normalizes EOLs for str
+        # payloads, and Gmail rejects bare-LF messages, so the template
+        # bytes are folded to CRLF here
+        payload = (
+            self._email_header_blob
+            + f"Subject: {Header(subject, 'utf-8').encode()}\r\n\r\n".encode('ascii')
+            + html_body.replace(b'\r\n', b'\n').replace(b'\n', b'\r\n')
+        )
+
+        # Send over the persistent connection; one reconnect attempt
+        # covers servers that dropped an idle session
         try:
-            with smtplib.SMTP(settings.smtp_server, settings.smtp_port) as server:
-                server.starttls()
-                server.login(settings.sender_email, settings.email_password)
-                server.send_message(msg)
-                
+            with self._smtp_lock:
+                try:
+                    if self._smtp is None:
+                        self._smtp = self._connect_smtp()
+                    self._smtp.sendmail(
+                        settings.sender_email, settings.receiver_emails, payload
+                    )
+                except (smtplib.SMTPException, OSError):
+                    self._close_smtp()
+                    self._smtp = self._connect_smtp()
+                    self._smtp.sendmail(
+                        settings.sender_email, settings.receiver_emails, payload
+                    )
+
             logger.info(f"📧 Beautiful HTML email sent to {len(settings.receiver_emails)} recipients")
-            
+
         except Exception as e:
+            self._close_smtp()
             logger.error(f"❌ Email sending failed: {e}")
             raise
+
+    def _connect_smtp(self):
+        """Open and authenticate a fresh SMTP connection"""
+        server = smtplib.SMTP(settings.smtp_server, settings.smtp_port)
+        server.starttls()
+        server.login(settings.sender_email, settings.email_password)
+        return server
+
+    def _close_smtp(self):
+        """Drop the cached SMTP connection (best effort)"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
     
     def _get_simple_message(self, pool_address: str, token0: str, token1: str, 
                            fee: int, liquidity: int, notification_type: str, settings) -> str:
@@ -547,8 +842,17 @@ class NotificationManager:
 notification_manager = NotificationManager()
 
 def involves_target_token(token0: str, token1: str) -> bool:
-    """Check if either token matches our target"""
-    return token0.lower() == settings.token_address or token1.lower() == settings.token_address
+    """Check if either token matches our target (caller lowercases once at decode)"""
+    return token0 == settings.token_address or token1 == settings.token_address
+
+def _log_notification_result(future):
+    """Log a queued notification's outcome once delivery finishes"""
+    try:
+        result = future.result()
+    except Exception as e:
+        logger.error(f"📧 Notification delivery failed: {e}")
+    else:
+        logger.info(f"📧 Notification result: {result}")
 
 def process_pool_event(event, w3: Web3):
     """Process a new pool creation event"""
@@ -590,71 +894,125 @@ def process_pool_event(event, w3: Web3):
         logger.info(f"⚠️  Pool has insufficient liquidity: {liquidity_amount:,} (need {settings.min_liquidity_threshold:,})")
         logger.info("📡 Will monitor this pool for liquidity additions...")
     
-    result = notification_manager.send_notification(
+    future = notification_manager.send_notification(
         pool_address, token0, token1, fee, liquidity_amount, notification_type
     )
-    
-    logger.info(f"📧 Notification result: {result}")
+    # send_notification returns the dispatch-pool future; log the real
+    # outcome when delivery finishes instead of blocking the event path
+    future.add_done_callback(_log_notification_result)
     print("-" * 60)
 
 def check_existing_pools_parallel(w3: Web3):
-    """Check existing pools for liquidity changes using thread pool"""
-    
+    """Check existing pools for liquidity changes via one Multicall batch"""
+
     non_tradeable_pools = db.get_non_tradeable_pools()
-    
+
     if not non_tradeable_pools:
         return
-    
+
     logger.info(f"🔍 Checking {len(non_tradeable_pools)} pools for liquidity changes...")
-    
-    def check_single_pool(pool_data):
-        """Check a single pool's liquidity"""
+
+    liquidity_by_pool = batch_check_pool_liquidity(
+        w3, [pool_data['address'] for pool_data in non_tradeable_pools]
+    )
+
+    tradeable_found = 0
+    for pool_data in non_tradeable_pools:
         try:
             pool_address = pool_data['address']
-            has_liquidity, current_liquidity = check_pool_liquidity_with_retry(w3, pool_address)
-            
+            current_liquidity = liquidity_by_pool.get(pool_address)
+            if current_liquidity is None:
+                continue  # call failed - already logged and counted
+
             # If pool became tradeable
-            if has_liquidity and not pool_data['is_tradeable']:
+            if current_liquidity >= settings.min_liquidity_threshold and not pool_data['is_tradeable']:
                 logger.info(f"🚀 POOL BECAME TRADEABLE!")
                 logger.info(f"📍 Pool: {pool_address}")
                 logger.info(f"💰 Liquidity: {current_liquidity:,} (was: {pool_data['current_liquidity']:,})")
-                
+
                 # Update database
                 db.mark_pool_tradeable(pool_address, current_liquidity)
-                
+
                 # Send notification
-                result = notification_manager.send_notification(
+                notification_manager.send_notification(
                     pool_address,
                     pool_data['token0'],
-                    pool_data['token1'], 
+                    pool_data['token1'],
                     pool_data['fee'],
                     current_liquidity,
                     "liquidity_added"
-                )
-                
+                ).add_done_callback(_log_notification_result)
+
                 logger.info("🎉 " + "="*50)
-                return True
-            
-            return False
-            
+                tradeable_found += 1
+
         except Exception as e:
             logger.error(f"Error checking pool {pool_data['address']}: {e}")
-            return False
-    
-    # Use thread pool for parallel processing
-    with ThreadPoolExecutor(max_workers=settings.max_worker_threads) as executor:
-        futures = [executor.submit(check_single_pool, pool) for pool in non_tradeable_pools]
-        
-        tradeable_found = 0
-        for future in as_completed(futures):
+
+    if tradeable_found > 0:
+        logger.info(f"✨ Found {tradeable_found} newly tradeable pools!")
+
+async def websocket_monitoring_loop(w3):
+    """Push-based monitoring over an eth_subscribe websocket
+
+    Instead of polling eth_blockNumber + eth_getLogs every cycle, the node
+    pushes matching PoolCreated logs the moment they are mined - discovery
+    latency drops from the polling interval to the websocket push latency,
+    and quiet periods cost zero RPC calls. The periodic liquidity sweep
+    runs as a sibling task on the same event loop, dispatched to a worker
+    thread so a slow sweep never blocks the subscription reader.
+
+    The sync HTTP w3 is kept for liquidity calls and event decoding so the
+    multicall/notification paths are shared with polling mode.
+    """
+    from web3 import AsyncWeb3
+    from web3.providers.persistent import WebSocketProvider
+
+    factory_contract = w3.eth.contract(address=FACTORY_ADDRESS, abi=FACTORY_ABI)
+    ws_url = f"wss://mainnet.infura.io/ws/v3/{settings.infura_api_key}"
+
+    async def liquidity_sweeper():
+        """Periodic sweep of non-tradeable pools, off the reader task"""
+        while True:
+            await asyncio.sleep(settings.liquidity_check_interval)
             try:
-                if future.result():
-                    tradeable_found += 1
+                await asyncio.to_thread(check_existing_pools_parallel, w3)
+                stats = await asyncio.to_thread(db.get_stats)
+                active_pools_gauge.set(stats['total_pools'])
             except Exception as e:
-                logger.error(f"Thread execution error: {e}")
-        
-        if tradeable_found > 0:
-            logger.info(f"✨ Found {tradeable_found} newly tradeable pools!")
+                logger.error(f"❌ Error in liquidity sweep: {e}")
+
+    async with AsyncWeb3(WebSocketProvider(ws_url)) as ws3:
+        # One subscription per token position, filtered server-side just
+        # like the polling path's eth_getLogs topics
+        for topics in ([POOL_CREATED_TOPIC, TARGET_TOKEN_TOPIC, None],
+                       [POOL_CREATED_TOPIC, None, TARGET_TOKEN_TOPIC]):
+            await ws3.eth.subscribe('logs', {
+                'address': FACTORY_ADDRESS,
+                'topics': topics
+            })
+        logger.info("🔌 Subscribed to PoolCreated logs over websocket")
+
+        sweeper = asyncio.create_task(liquidity_sweeper())
+        try:
+            # Bounded dedup window - both subscriptions deliver the same
+            # log, but only within moments of each other, so a few
+            # thousand recent keys suffice and the set cannot grow for
+            # the lifetime of the socket
+            seen_logs = OrderedDict()
+            async for payload in ws3.socket.process_subscriptions():
+                raw_log = payload['result']
+                log_key = (raw_log['transactionHash'], raw_log['logIndex'])
+                if log_key in seen_logs:
+                    continue  # delivered by both subscriptions
+                seen_logs[log_key] = None
+                if len(seen_logs) > SEEN_LOGS_MAX:
+                    seen_logs.popitem(last=False)
+
+                event = factory_contract.events.PoolCreated().process_log(raw_log)
+                await asyncio.to_thread(process_pool_event, event, w3)
+        finally:
+            sweeper.cancel()
 
 def main_monitoring_loop():
     """Main monitoring loop with enhanced error handling"""
@@ -664,86 +1022,131 @@ def main_monitoring_loop():
     logger.info(f"💰 Liquidity Threshold: {settings.min_liquidity_threshold:,}")
     logger.info(f"📧 Notification Channels: {len(notification_manager.apobj.servers)}")
     
-    # Start metrics server
-    try:
-        start_http_server(settings.metrics_port, registry=METRICS_REGISTRY)
-        logger.info(f"📊 Metrics server started on port {settings.metrics_port}")
-    except Exception as e:
-        logger.warning(f"Could not start metrics server: {e}")
+    # Start metrics server (METRICS_PORT <= 0 disables it, e.g. in dev)
+    if settings.metrics_port > 0:
+        try:
+            start_http_server(settings.metrics_port, registry=METRICS_REGISTRY)
+            logger.info(f"📊 Metrics server started on port {settings.metrics_port}")
+        except Exception as e:
+            logger.warning(f"Could not start metrics server: {e}")
     
     # Initialize Web3
     w3 = create_web3_connection()
-    
+
+    # Push-based mode - fall through to HTTP polling if it fails
+    if settings.use_websocket:
+        try:
+            asyncio.run(websocket_monitoring_loop(w3))
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            logger.error(f"💥 Websocket listener failed: {e}")
+            logger.info("⏳ Falling back to HTTP polling...")
+
     # Uniswap V3 Factory setup
-    factory_address = '0x1F98431c8aD98523631AE4a59f267346ea31F984'
-factory_abi = [
-    {
-        "anonymous": False,
-        "inputs": [
-            {"indexed": True, "name": "token0", "type": "address"},
-            {"indexed": True, "name": "token1", "type": "address"},
-            {"indexed": True, "name": "fee", "type": "uint24"},
-            {"name": "tickSpacing", "type": "int24"},
-            {"name": "pool", "type": "address"}
-        ],
-        "name": "PoolCreated",
-        "type": "event"
-    }
-]
-    factory_contract = w3.eth.contract(address=factory_address, abi=factory_abi)
-    
-    # Get starting position
-    latest_block = w3.eth.get_block('latest')['number']
-    last_liquidity_check = time.time()
-    
+    factory_contract = w3.eth.contract(address=FACTORY_ADDRESS, abi=FACTORY_ABI)
+
+    # Get starting position - eth_blockNumber returns just the number,
+    # not a full header JSON
+    latest_block = w3.eth.block_number
+
     logger.info(f"🏁 Starting from block: {latest_block}")
     logger.info("="*60)
-    
+
+    def poll_new_pools():
+        nonlocal latest_block
+
+        # Check for new pools
+        latest_header = w3.eth.get_block('latest')
+        current_block = latest_header['number']
+
+        if (current_block == latest_block + 1
+                and not bloom_may_contain_pool_created(latest_header['logsBloom'])):
+            # Single new block and its bloom (already in hand from the
+            # get_block above) proves no matching log - skip the
+            # eth_getLogs round trips entirely. Multi-block ranges
+            # still go through getLogs, since fetching each header to
+            # test blooms would cost more than the one log query.
+            latest_block = current_block
+        elif current_block > latest_block:
+            # One eth_getLogs per token position - create_filter costs
+            # two RPCs for a filter that is thrown away immediately,
+            # and filtering on the padded token topic means the node
+            # returns only pools involving the target token instead of
+            # every Uniswap pool created in the range
+            raw_logs = []
+            seen_logs = set()
+            for topics in ([POOL_CREATED_TOPIC, TARGET_TOKEN_TOPIC, None],
+                           [POOL_CREATED_TOPIC, None, TARGET_TOKEN_TOPIC]):
+                for raw_log in w3.eth.get_logs({
+                    'address': FACTORY_ADDRESS,
+                    'topics': topics,
+                    'fromBlock': latest_block + 1,
+                    'toBlock': current_block
+                }):
+                    # Cheap string compare before the ABI decode guards
+                    # against permissive providers returning non-factory
+                    # logs for this query
+                    if raw_log['address'].lower() != FACTORY_LC:
+                        continue
+                    log_key = (raw_log['transactionHash'], raw_log['logIndex'])
+                    if log_key not in seen_logs:
+                        seen_logs.add(log_key)
+                        raw_logs.append(raw_log)
+
+            for raw_log in raw_logs:
+                event = factory_contract.events.PoolCreated().process_log(raw_log)
+                process_pool_event(event, w3)
+
+            latest_block = current_block
+
+    def sweep_existing_pools():
+        check_existing_pools_parallel(w3)
+
+        # Update metrics
+        stats = db.get_stats()
+        active_pools_gauge.set(stats['total_pools'])
+
+    # Monotonic job heap - each cadence is scheduled from its own
+    # deadline, so a slow poll no longer stretches the real polling
+    # period to poll-time + interval, and the sweep keeps its cadence
+    # independent of the poll's. Monotonic time is immune to wall-clock
+    # jumps.
+    jobs = {'poll': poll_new_pools, 'sweep': sweep_existing_pools}
+    intervals = {'poll': settings.polling_interval, 'sweep': settings.liquidity_check_interval}
+    now = time.monotonic()
+    schedule = [(now, 'poll'), (now + settings.liquidity_check_interval, 'sweep')]
+
     while True:
+        run_at, kind = heapq.heappop(schedule)
+        delay = run_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
         try:
-            current_time = time.time()
-            
-            # Check for new pools
-            current_block = w3.eth.get_block('latest')['number']
-            
-            if current_block > latest_block:
-                event_filter = factory_contract.events.PoolCreated.create_filter(
-                    from_block=latest_block + 1,
-                    to_block=current_block
-                )
-                
-                events = event_filter.get_all_entries()
-                
-                for event in events:
-                    process_pool_event(event, w3)
-                
-                latest_block = current_block
-            
-            # Periodically check existing pools
-            if current_time - last_liquidity_check >= settings.liquidity_check_interval:
-                check_existing_pools_parallel(w3)
-                last_liquidity_check = current_time
-                
-                # Update metrics
-                stats = db.get_stats()
-                active_pools_gauge.set(stats['total_pools'])
-            
-            # Sleep until next poll
-            time.sleep(settings.polling_interval)
-            
+            jobs[kind]()
+            # Schedule from the deadline, not from completion, clamped
+            # to now so a long stall doesn't cause a catch-up burst
+            next_at = max(run_at + intervals[kind], time.monotonic())
         except KeyboardInterrupt:
             raise
         except Exception as e:
             logger.error(f"💥 Error in main loop: {e}")
             logger.info("⏳ Waiting 30 seconds before retry...")
-            time.sleep(30)
+            next_at = time.monotonic() + 30
+        heapq.heappush(schedule, (next_at, kind))
 
 if __name__ == "__main__":
     try:
         main_monitoring_loop()
     except KeyboardInterrupt:
         logger.info("🛑 Shutdown requested...")
-        
+
+        # Let queued notifications finish sending
+        try:
+            notification_manager.shutdown()
+        except Exception:
+            pass
+
         # Print final statistics
         try:
             stats = db.get_stats()
@@ -8,8 +8,10 @@ Pool Monitor
 import asyncio
 import time
 from typing import List, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+from web3.exceptions import Web3RPCError
+
+from .web3_client import is_range_rejection
 
 logger = logging.getLogger(__name__)
 
@@ -22,19 +24,49 @@ class PoolMonitor:
         self.notification_manager = notification_manager
         self.settings = settings
         self.metrics_server = metrics_server
-        self.executor = ThreadPoolExecutor(max_workers=settings.max_worker_threads)
-        self.latest_processed_block = self.web3_client.get_latest_block()
+        # Resume from the persisted position so pools created while the
+        # process was down are still caught; first run starts at head
+        persisted_block = db.get_meta('last_processed_block')
+        if persisted_block is not None:
+            self.latest_processed_block = int(persisted_block)
+            logger.info(f"⏮️ Resuming from persisted block {self.latest_processed_block}")
+        else:
+            self.latest_processed_block = self.web3_client.get_latest_block()
+        # Adaptive eth_getLogs range - halved when the provider rejects
+        # or times out a query, regrown on success; persists across
+        # cycles so re-syncs keep the learned step
+        self._blocks_per_step = settings.max_blocks_per_step
+        # Adaptive poll interval - tightened during event bursts,
+        # relaxed back to polling_interval when idle
+        self._sleep = float(settings.polling_interval)
+        # Raw-log dispatch by topic0 - adding another event type (Mint/
+        # Burn/Swap on known pools) is one entry here plus its signature
+        # in a shared get_event_logs query, not another RPC per type
+        self._log_handlers = {
+            self.web3_client.pool_created_topic: self._handle_pool_created_log,
+        }
         
     async def start_monitoring(self):
         """Start the main monitoring loop"""
         logger.info(f"🔍 Starting {self.settings.token_symbol} pool monitoring...")
         logger.info(f"📍 Target token: {self.settings.token_address}")
         logger.info(f"💰 Minimum liquidity: {self.settings.min_liquidity_threshold:,}")
-        
+
+        # Push-based mode - fall through to HTTP polling if it fails
+        if self.settings.use_websocket:
+            try:
+                await self._monitor_websocket()
+            except KeyboardInterrupt:
+                logger.info("👋 Monitoring stopped by user")
+                return
+            except Exception as e:
+                logger.error(f"💥 Websocket monitoring failed: {e}")
+                logger.info("⏳ Falling back to HTTP polling...")
+
         while True:
             try:
                 await self._monitor_cycle()
-                await asyncio.sleep(self.settings.polling_interval)
+                await asyncio.sleep(self._sleep)
                 
             except KeyboardInterrupt:
                 logger.info("👋 Monitoring stopped by user")
@@ -43,11 +75,67 @@ class PoolMonitor:
                 logger.error(f"💥 Error in monitoring cycle: {e}")
                 await asyncio.sleep(30)  # Wait before retrying
     
+    async def _monitor_websocket(self):
+        """Push-based monitoring over an eth_subscribe websocket
+
+        The node pushes matching PoolCreated logs the moment they are
+        mined, so there is no polling sleep on the fast path - detection
+        latency drops from up to a polling interval to the push latency,
+        and idle periods cost zero RPC calls. The liquidity sweep and
+        metrics update keep their cadence as a sibling task.
+        """
+        from web3 import AsyncWeb3
+        from web3.providers.persistent import WebSocketProvider
+
+        async def sweep_loop():
+            while True:
+                await asyncio.sleep(self.settings.liquidity_check_interval)
+                await self._check_existing_pools()
+                if self.metrics_server:
+                    stats = self.db.get_stats()
+                    self.metrics_server.active_pools_gauge.set(stats.get('total_pools', 0))
+                    self.metrics_server.tradeable_pools_gauge.set(stats.get('tradeable_pools', 0))
+
+        token_topic = self.web3_client.address_topic(self.settings.token_address)
+
+        async with AsyncWeb3(WebSocketProvider(self.settings.infura_ws_url)) as ws3:
+            # One subscription per indexed token position, so the node
+            # only pushes pools involving the target token
+            for topics in ([self.web3_client.pool_created_topic, token_topic, None],
+                           [self.web3_client.pool_created_topic, None, token_topic]):
+                await ws3.eth.subscribe('logs', {
+                    'address': self.web3_client.uniswap_factory_address,
+                    'topics': topics
+                })
+            logger.info("🔌 Subscribed to PoolCreated logs over websocket")
+
+            sweeper = asyncio.create_task(sweep_loop())
+            try:
+                async for payload in ws3.socket.process_subscriptions():
+                    raw_log = payload['result']
+                    topic0 = '0x' + raw_log['topics'][0].hex().removeprefix('0x')
+                    handler = self._log_handlers.get(topic0)
+                    if handler is not None:
+                        await handler(raw_log)
+            finally:
+                sweeper.cancel()
+
+    async def _handle_pool_created_log(self, raw_log):
+        """Decode and process one raw PoolCreated log"""
+        await self._process_pool_event(self.web3_client.decode_pool_created(raw_log))
+
     async def _monitor_cycle(self):
         """Single monitoring cycle"""
-        # Check for new pools
-        await self._check_new_pools()
-        
+        # Check for new pools; adapt the poll interval to activity -
+        # halve it while events keep arriving (bursts of pool creations
+        # cluster in adjacent blocks), ease back toward the configured
+        # interval when the chain is quiet
+        events_seen = await self._check_new_pools()
+        if events_seen:
+            self._sleep = max(0.2, self._sleep / 2)
+        else:
+            self._sleep = min(self.settings.polling_interval, self._sleep * 1.5)
+
         # Check existing pools for liquidity changes
         await self._check_existing_pools()
         
@@ -55,69 +143,97 @@ class PoolMonitor:
         if self.metrics_server:
             stats = self.db.get_stats()
             self.metrics_server.active_pools_gauge.set(stats.get('total_pools', 0))
+            self.metrics_server.tradeable_pools_gauge.set(stats.get('tradeable_pools', 0))
     
-    async def _check_new_pools(self):
-        """Check for new pool creation events"""
+    async def _check_new_pools(self) -> int:
+        """Check for new pool creation events
+
+        Returns the number of events seen, which drives the adaptive
+        polling interval.
+        """
+        events_seen = 0
         try:
             current_block = self.web3_client.get_latest_block()
-            
+
             if current_block <= self.latest_processed_block:
-                return
-            
+                return 0
+
             # Calculate block range
             from_block = self.latest_processed_block + 1
             blocks_to_check = current_block - from_block + 1
             
-            logger.debug(f"🔍 Checking blocks {from_block} to {current_block} ({blocks_to_check} blocks)")
-            
-            # If too many blocks, process in chunks to avoid RPC limits
-            MAX_BLOCKS_PER_QUERY = 1000  # Safe limit for most RPC providers
-            
-            if blocks_to_check > MAX_BLOCKS_PER_QUERY:
+            # %-style args defer formatting until DEBUG is actually on -
+            # catch-up loops otherwise build these strings per chunk
+            logger.debug("🔍 Checking blocks %s to %s (%s blocks)", from_block, current_block, blocks_to_check)
+
+            if blocks_to_check > self._blocks_per_step:
                 logger.info(f"📦 Large block range detected ({blocks_to_check} blocks), processing in chunks...")
-                
-                # Process in chunks
-                for chunk_start in range(from_block, current_block + 1, MAX_BLOCKS_PER_QUERY):
-                    chunk_end = min(chunk_start + MAX_BLOCKS_PER_QUERY - 1, current_block)
-                    
-                    logger.debug(f"📦 Processing chunk: {chunk_start} to {chunk_end}")
-                    
-                    # Create event filter for chunk
-                    event_filter = self.web3_client.create_event_filter(
-                        from_block=chunk_start,
-                        to_block=chunk_end
+
+            # Process in adaptively-sized chunks: a "query returned more
+            # than N results" or timeout halves the step and retries the
+            # same start; success regrows it toward the configured max
+            chunk_start = from_block
+            while chunk_start <= current_block:
+                chunk_end = min(chunk_start + self._blocks_per_step - 1, current_block)
+
+                logger.debug("📦 Processing chunk: %s to %s", chunk_start, chunk_end)
+
+                # Stateless eth_getLogs, server-filtered by the target
+                # token - typically 0-1 logs instead of every pool in
+                # the range, and no throwaway filter ID on the node
+                try:
+                    events = self.web3_client.get_pool_created_logs(
+                        chunk_start, chunk_end, self.settings.token_address
                     )
-                    
-                    if event_filter:
-                        # Get events for this chunk
-                        events = self.web3_client.get_events(event_filter)
-                        
-                        for event in events:
-                            await self._process_pool_event(event)
-                    
-                    # Update progress
-                    self.latest_processed_block = chunk_end
-                    
+                except (ValueError, Web3RPCError) as e:
+                    # web3 v7 surfaces provider rejections as
+                    # Web3RPCError, not ValueError - both are handled so
+                    # the shrink logic fires either way
+                    if (is_range_rejection(e)
+                            and self._blocks_per_step > self.settings.min_blocks_per_step):
+                        self._blocks_per_step = max(
+                            self._blocks_per_step // 2, self.settings.min_blocks_per_step
+                        )
+                        logger.warning(f"⚠️ Provider rejected range, shrinking step to {self._blocks_per_step} blocks")
+                        continue
+                    raise
+
+                if len(events) > 1:
+                    # Burst: persist the whole chunk in one transaction
+                    # up front, so the pools survive a crash mid-way
+                    # through the per-event alerting below; the per-event
+                    # upserts then just refresh liquidity in place
+                    self.db.save_pools_bulk([{
+                        'address': event['args']['pool'].lower(),
+                        'token0': event['args']['token0'].lower(),
+                        'token1': event['args']['token1'].lower(),
+                        'fee': event['args']['fee'],
+                        'liquidity': 0
+                    } for event in events])
+
+                for event in events:
+                    await self._process_pool_event(event)
+                events_seen += len(events)
+
+                # Range was accepted - grow back toward the cap
+                self._blocks_per_step = min(
+                    self._blocks_per_step * 2, self.settings.max_blocks_per_step
+                )
+
+                # Update progress - persisted so a restart resumes here
+                # instead of silently skipping to the new head
+                self.latest_processed_block = chunk_end
+                self.db.set_meta('last_processed_block', chunk_end)
+                chunk_start = chunk_end + 1
+
+                if chunk_start <= current_block:
                     # Small delay between chunks to be nice to RPC
                     await asyncio.sleep(0.1)
-            else:
-                # Normal processing for small ranges
-                event_filter = self.web3_client.create_event_filter(
-                    from_block=from_block,
-                    to_block=current_block
-                )
-                
-                if event_filter:
-                    events = self.web3_client.get_events(event_filter)
-                    
-                    for event in events:
-                        await self._process_pool_event(event)
-                
-                self.latest_processed_block = current_block
-            
+
         except Exception as e:
             logger.error(f"❌ Error checking new pools: {e}")
-    
+        return events_seen
+
     async def _process_pool_event(self, event):
         """Process a pool creation event"""
         try:
@@ -136,21 +252,21 @@ class PoolMonitor:
             
             # Update metrics
             if self.metrics_server:
-                self.metrics_server.pools_discovered_total.labels(
-                    token_symbol=self.settings.token_symbol
-                ).inc()
+                self.metrics_server.inc_pools_discovered(self.settings.token_symbol)
             
-            # Check initial liquidity
-            has_liquidity, liquidity_amount = self.web3_client.check_pool_liquidity(
+            # The alert content (type, figure, banner) depends on the
+            # liquidity result, so the RPC is awaited before composing -
+            # the save is what overlaps the notification send below
+            has_liquidity, liquidity_amount = await asyncio.to_thread(
+                self.web3_client.check_pool_liquidity,
                 pool_address, self.settings.min_liquidity_threshold
             )
-            
+
             # Update liquidity check metrics
             if self.metrics_server:
                 status = "sufficient" if has_liquidity else "insufficient"
-                self.metrics_server.liquidity_checks_total.labels(status=status).inc()
-            
-            # Save to database
+                self.metrics_server.inc_liquidity_checks(status)
+
             pool_data = {
                 'address': pool_address,
                 'token0': token0,
@@ -158,31 +274,31 @@ class PoolMonitor:
                 'fee': fee,
                 'liquidity': liquidity_amount
             }
-            self.db.save_pool(pool_data)
-            
-            # Send notification
+
             notification_type = "liquidity_added" if has_liquidity else "pool_created"
-            
+
             if has_liquidity:
                 logger.info(f"💰 POOL HAS SUFFICIENT LIQUIDITY: {liquidity_amount:,} - TRADEABLE! 🚀")
             else:
                 logger.info(f"⚠️  Pool has insufficient liquidity: {liquidity_amount:,}")
                 logger.info("📡 Will monitor this pool for liquidity additions...")
-            
-            # Time the notification sending
+
+            # Save and notify concurrently - the DB write costs a fsync,
+            # the alert an SMTP round trip, and neither depends on the
+            # other
             start_time = time.time()
-            await self.notification_manager.send_notification(
-                pool_address, token0, token1, fee, liquidity_amount, notification_type
+            await asyncio.gather(
+                asyncio.to_thread(self.db.save_pool, pool_data),
+                self.notification_manager.send_notification(
+                    pool_address, token0, token1, fee, liquidity_amount, notification_type
+                )
             )
-            
+
             # Update notification metrics
             if self.metrics_server:
                 notification_time = time.time() - start_time
                 self.metrics_server.notification_latency_seconds.observe(notification_time)
-                self.metrics_server.notifications_sent_total.labels(
-                    notification_type=notification_type,
-                    channel="multi"
-                ).inc()
+                self.metrics_server.inc_notifications_sent(notification_type, "multi")
             
         except Exception as e:
             logger.error(f"❌ Error processing pool event: {e}")
@@ -195,79 +311,70 @@ class PoolMonitor:
             if not non_tradeable_pools:
                 return
             
-            logger.debug(f"🔍 Checking {len(non_tradeable_pools)} pools for liquidity changes")
-            
-            # Check pools in parallel
-            loop = asyncio.get_event_loop()
-            tasks = []
-            
+            logger.debug("🔍 Checking %s pools for liquidity changes", len(non_tradeable_pools))
+
+            # One Multicall3 batch instead of a thread per pool - the
+            # per-pool path was N HTTP round trips of pure node latency
+            liquidity_by_pool = await asyncio.to_thread(
+                self.web3_client.batch_check_liquidity,
+                [pool_data['address'] for pool_data in non_tradeable_pools]
+            )
+
+            # Collect transitions first - one bulk UPDATE per sweep
+            # instead of one commit (one fsync) per pool
+            became_tradeable = []
             for pool_data in non_tradeable_pools:
-                task = loop.run_in_executor(
-                    self.executor,
-                    self._check_single_pool,
-                    pool_data
+                pool_address = pool_data['address']
+                current_liquidity = liquidity_by_pool.get(pool_address)
+                if current_liquidity is None:
+                    continue  # call failed - already logged
+
+                has_liquidity = current_liquidity >= self.settings.min_liquidity_threshold
+
+                # Update liquidity check metrics
+                if self.metrics_server:
+                    status = "sufficient" if has_liquidity else "insufficient"
+                    self.metrics_server.inc_liquidity_checks(status)
+
+                if has_liquidity and not pool_data['is_tradeable']:
+                    logger.info(f"🚀 POOL BECAME TRADEABLE!")
+                    logger.info(f"📍 Pool: {pool_address}")
+                    logger.info(f"💰 Liquidity: {current_liquidity:,}")
+                    became_tradeable.append((pool_data, current_liquidity))
+
+            if became_tradeable:
+                self.db.mark_pools_tradeable([
+                    (pool_data['address'], current_liquidity)
+                    for pool_data, current_liquidity in became_tradeable
+                ])
+
+            for pool_data, current_liquidity in became_tradeable:
+                # Send notification
+                start_time = time.time()
+                await self.notification_manager.send_notification(
+                    pool_data['address'],
+                    pool_data['token0'],
+                    pool_data['token1'],
+                    pool_data['fee'],
+                    current_liquidity,
+                    "liquidity_added"
                 )
-                tasks.append(task)
-            
-            # Wait for all checks to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"❌ Pool check error: {result}")
-                    
+
+                # Update notification metrics
+                if self.metrics_server:
+                    notification_time = time.time() - start_time
+                    self.metrics_server.notification_latency_seconds.observe(notification_time)
+                    self.metrics_server.inc_notifications_sent("liquidity_added", "multi")
+
         except Exception as e:
             logger.error(f"❌ Error checking existing pools: {e}")
     
-    def _check_single_pool(self, pool_data: Dict):
-        """Check a single pool's liquidity (runs in thread pool)"""
-        try:
-            pool_address = pool_data['address']
-            has_liquidity, current_liquidity = self.web3_client.check_pool_liquidity(
-                pool_address, self.settings.min_liquidity_threshold
-            )
-            
-            # Update liquidity check metrics
-            if self.metrics_server:
-                status = "sufficient" if has_liquidity else "insufficient"
-                self.metrics_server.liquidity_checks_total.labels(status=status).inc()
-            
-            # If pool became tradeable
-            if has_liquidity and not pool_data['is_tradeable']:
-                logger.info(f"🚀 POOL BECAME TRADEABLE!")
-                logger.info(f"📍 Pool: {pool_address}")
-                logger.info(f"💰 Liquidity: {current_liquidity:,}")
-                
-                # Update database
-                self.db.mark_pool_tradeable(pool_address, current_liquidity)
-                
-                # Send notification (schedule on main thread)
-                async def send_notification():
-                    start_time = time.time()
-                    await self.notification_manager.send_notification(
-                        pool_address,
-                        pool_data['token0'],
-                        pool_data['token1'],
-                        pool_data['fee'],
-                        current_liquidity,
-                        "liquidity_added"
-                    )
-                    
-                    # Update notification metrics
-                    if self.metrics_server:
-                        notification_time = time.time() - start_time
-                        self.metrics_server.notification_latency_seconds.observe(notification_time)
-                        self.metrics_server.notifications_sent_total.labels(
-                            notification_type="liquidity_added",
-                            channel="multi"
-                        ).inc()
-                
-                asyncio.create_task(send_notification())
-                
-        except Exception as e:
-            logger.error(f"❌ Error checking single pool: {e}")
-    
     def _involves_target_token(self, token0: str, token1: str) -> bool:
-        """Check if either token matches our target"""
-        return (token0.lower() == self.settings.token_address.lower() or 
-                token1.lower() == self.settings.token_address.lower()) 
\ No newline at end of file
+        """Check if either token matches our target
+
+        settings.token_address is already lowercased by its validator
+        and _process_pool_event lowercases the event-side values once at
+        decode, so this is two plain string comparisons per event.
+        """
+        return (token0 == self.settings.token_address or
+                token1 == self.settings.token_address)
\ No newline at end of file
@@ -6,14 +6,69 @@ Web3 Client
 """
 
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
-from web3.exceptions import Web3Exception
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from web3._utils.events import get_event_data
+from web3.exceptions import Web3Exception, Web3RPCError
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception, retry_if_exception_type
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Multicall3 - same address on mainnet and most EVM chains
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+MULTICALL3_ABI = [
+    {
+        "inputs": [{
+            "components": [
+                {"name": "target", "type": "address"},
+                {"name": "allowFailure", "type": "bool"},
+                {"name": "callData", "type": "bytes"}
+            ],
+            "name": "calls",
+            "type": "tuple[]"
+        }],
+        "name": "aggregate3",
+        "outputs": [{
+            "components": [
+                {"name": "success", "type": "bool"},
+                {"name": "returnData", "type": "bytes"}
+            ],
+            "name": "returnData",
+            "type": "tuple[]"
+        }],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+LIQUIDITY_SELECTOR = Web3.keccak(text='liquidity()')[:4]
+MULTICALL_CHUNK = 500  # stays well under provider gas caps
+
+# Ranges at least this deep below head are treated as reorg-safe and
+# their decoded logs cached
+FINALITY_CONFIRMATIONS = 12
+LOG_CACHE_MAX = 4096
+
+def is_range_rejection(exc: BaseException) -> bool:
+    """Whether an RPC error is a deterministic block-range rejection
+
+    Providers reject oversized eth_getLogs ranges with a "more than N
+    results" or timeout error; retrying the identical range can never
+    succeed, so callers must shrink the range instead.
+    """
+    message = str(exc).lower()
+    return 'more than' in message or 'timeout' in message
+
+def _should_retry_get_logs(exc: BaseException) -> bool:
+    """Retry transient failures, but surface range rejections at once"""
+    if isinstance(exc, Web3RPCError) and is_range_rejection(exc):
+        return False
+    return isinstance(exc, (Web3Exception, ConnectionError))
+
 class Web3Client:
     """Web3 client with retry logic and connection management"""
     
@@ -21,6 +76,8 @@ class Web3Client:
         self.infura_url = infura_url
         self.w3 = self._create_connection()
         self.uniswap_factory_address = "0x1F98431c8aD98523631AE4a59f267346ea31F984"
+        # Lowercased once for the cheap pre-decode address compare
+        self._factory_lc = self.uniswap_factory_address.lower()
         self.uniswap_factory_abi = [
             {
                 "anonymous": False,
@@ -35,19 +92,70 @@ class Web3Client:
                 "type": "event"
             }
         ]
-        self.pool_abi = [
-            {
-                "inputs": [],
-                "name": "liquidity",
-                "outputs": [{"name": "", "type": "uint128"}],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
         self.contract = self.w3.eth.contract(
             address=self.uniswap_factory_address,
             abi=self.uniswap_factory_abi
         )
+        # Topic0 of PoolCreated - used for server-side log filtering and
+        # websocket subscriptions
+        self.pool_created_topic = '0x' + Web3.keccak(
+            text='PoolCreated(address,address,uint24,int24,address)'
+        ).hex().removeprefix('0x')
+        self.multicall = self.w3.eth.contract(
+            address=MULTICALL3_ADDRESS,
+            abi=MULTICALL3_ABI
+        )
+        # Event ABI schema cached once - decode_pool_created calls
+        # get_event_data directly instead of re-entering the
+        # contract-events wrapper (which re-resolves the ABI per call)
+        self._pool_created_abi = self.contract.events.PoolCreated().abi
+        # LRU of decoded logs for finalized ranges - re-fetching the
+        # same range (catch-up after a transient failure) becomes free
+        self._log_cache = OrderedDict()
+        self._latest_block = 0
+
+    def batch_check_liquidity(self, pool_addresses: list) -> dict:
+        """Fetch liquidity() for many pools with one aggregate3 call per chunk
+
+        Returns {address: liquidity} with None for pools whose call
+        failed - N per-pool eth_calls collapse into ceil(N/500) RPCs,
+        and multiple chunks go out concurrently so the sweep costs about
+        one round-trip time regardless of pool count.
+        """
+        def _call_chunk(chunk):
+            calls = [(Web3.to_checksum_address(address), True, LIQUIDITY_SELECTOR)
+                     for address in chunk]
+            try:
+                return self.multicall.functions.aggregate3(calls).call()
+            except Exception as e:
+                logger.error(f"❌ Multicall liquidity batch failed: {e}")
+                return [(False, b'')] * len(chunk)
+
+        chunks = [pool_addresses[start:start + MULTICALL_CHUNK]
+                  for start in range(0, len(pool_addresses), MULTICALL_CHUNK)]
+        if len(chunks) <= 1:
+            returned_per_chunk = [_call_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), 8)) as executor:
+                returned_per_chunk = list(executor.map(_call_chunk, chunks))
+
+        results = {}
+        for chunk, returned in zip(chunks, returned_per_chunk):
+            for address, (success, return_data) in zip(chunk, returned):
+                if success and len(return_data) >= 32:
+                    results[address] = int.from_bytes(return_data[:32], 'big')
+                else:
+                    results[address] = None
+        return results
+
+    def decode_pool_created(self, raw_log) -> dict:
+        """Decode a raw PoolCreated log into the event-dict shape"""
+        return get_event_data(self.w3.codec, self._pool_created_abi, raw_log)
+
+    @staticmethod
+    def address_topic(address: str) -> str:
+        """Pad an address to the 32-byte topic form used in log filters"""
+        return '0x' + address[2:].rjust(64, '0').lower()
     
     @retry(
         stop=stop_after_attempt(3),
@@ -55,9 +163,24 @@ class Web3Client:
         retry=retry_if_exception_type((Web3Exception, ConnectionError))
     )
     def _create_connection(self) -> Web3:
-        """Create Web3 connection with retry logic"""
+        """Create Web3 connection with retry logic
+
+        A shared keep-alive session backs every RPC, so calls reuse
+        established TLS connections instead of paying TCP + handshake
+        setup each time; the pool is sized for the concurrent multicall
+        chunk dispatch.
+        """
         try:
-            w3 = Web3(Web3.HTTPProvider(self.infura_url))
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=16,
+                max_retries=0
+            ))
+            w3 = Web3(Web3.HTTPProvider(
+                self.infura_url, session=session,
+                request_kwargs={'timeout': 10}
+            ))
             
             if not w3.is_connected():
                 raise ConnectionError("Failed to connect to Ethereum node")
@@ -75,17 +198,21 @@ class Web3Client:
         retry=retry_if_exception_type((Web3Exception, ConnectionError))
     )
     def check_pool_liquidity(self, pool_address: str, min_threshold: int) -> Tuple[bool, int]:
-        """Check pool liquidity with retry logic"""
+        """Check pool liquidity with retry logic
+
+        Raw eth_call with the precomputed liquidity() selector - no
+        per-call contract object or ABI encode/decode. liquidity() is a
+        uint128, so the value lives in the low 16 bytes of the word.
+        """
         try:
-            pool_contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(pool_address),
-                abi=self.pool_abi
-            )
-            
-            liquidity = pool_contract.functions.liquidity().call()
+            result = self.w3.eth.call({
+                'to': Web3.to_checksum_address(pool_address),
+                'data': LIQUIDITY_SELECTOR
+            })
+            liquidity = int.from_bytes(result[-16:], 'big')
             has_sufficient_liquidity = liquidity >= min_threshold
             
-            logger.debug(f"Pool {pool_address}: liquidity={liquidity}, threshold={min_threshold}")
+            logger.debug("Pool %s: liquidity=%s, threshold=%s", pool_address, liquidity, min_threshold)
             return has_sufficient_liquidity, liquidity
             
         except Exception as e:
@@ -100,38 +227,97 @@ class Web3Client:
     def get_latest_block(self) -> int:
         """Get latest block number with retry logic"""
         try:
-            return self.w3.eth.block_number
+            self._latest_block = self.w3.eth.block_number
+            return self._latest_block
         except Exception as e:
             logger.error(f"❌ Failed to get latest block: {e}")
             raise
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=8),
-        retry=retry_if_exception_type((Web3Exception, ConnectionError))
-    )
-    def create_event_filter(self, from_block: int, to_block: int):
-        """Create event filter for PoolCreated events with retry logic"""
-        try:
-            return self.contract.events.PoolCreated.create_filter(
-                from_block=from_block,
-                to_block=to_block
-            )
-        except Exception as e:
-            logger.error(f"❌ Failed to create event filter: {e}")
-            raise
-    
     @retry(
         stop=stop_after_attempt(5),  # More retries for event retrieval
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((Web3Exception, ConnectionError))
+        # Range rejections are deterministic - retrying the same range
+        # burns ~30s of backoff before the caller's shrink logic can
+        # react, so they bypass the retry entirely
+        retry=retry_if_exception(_should_retry_get_logs)
     )
-    def get_events(self, event_filter):
-        """Get events from filter with retry logic - CRITICAL FIX"""
+    def _get_logs(self, params: dict) -> list:
+        """Raw eth_getLogs with retry logic"""
         try:
-            events = event_filter.get_all_entries()
-            logger.debug(f"✅ Retrieved {len(events)} events successfully")
-            return events
+            return self.w3.eth.get_logs(params)
         except Exception as e:
-            logger.error(f"❌ Failed to get events (retrying...): {e}")
-            raise  # Let retry decorator handle this 
\ No newline at end of file
+            logger.error(f"❌ Failed to get logs: {e}")
+            raise  # Let retry decorator handle this
+
+    def get_event_logs(self, from_block: int, to_block: int,
+                       topic0_list: list, address: str = None) -> list:
+        """Raw logs for several event signatures in one eth_getLogs
+
+        A nested list in topic position 0 ORs the signatures server-side,
+        so tracking N event types (e.g. Mint/Burn/Swap on known pools)
+        costs one RPC instead of one per type. Callers dispatch the
+        returned raw logs by their topics[0].
+        """
+        return self._get_logs({
+            'address': address or self.uniswap_factory_address,
+            'topics': [topic0_list],
+            'fromBlock': from_block,
+            'toBlock': to_block
+        })
+
+    def get_pool_created_logs(self, from_block: int, to_block: int,
+                              token_address: str = None) -> list:
+        """Fetch and decode PoolCreated events for a block range
+
+        One stateless eth_getLogs per topic set instead of the old
+        create_filter + get_all_entries pair, which cost two RPCs and a
+        server-side filter ID per throwaway range query. With a
+        token_address, the node filters on the padded token topic in
+        either indexed position (topics cannot OR across positions in
+        one query) and the two result sets are unioned.
+
+        Results for ranges buried FINALITY_CONFIRMATIONS blocks below
+        the last seen head are reorg-safe and served from a bounded LRU,
+        so re-walking a range after a transient failure costs no RPCs.
+        """
+        cache_key = (from_block, to_block, token_address)
+        cached = self._log_cache.get(cache_key)
+        if cached is not None:
+            self._log_cache.move_to_end(cache_key)
+            return list(cached)
+
+        if token_address is None:
+            topic_sets = [[self.pool_created_topic]]
+        else:
+            token_topic = self.address_topic(token_address)
+            topic_sets = [
+                [self.pool_created_topic, token_topic, None],
+                [self.pool_created_topic, None, token_topic],
+            ]
+
+        events = []
+        seen_logs = set()
+        for topics in topic_sets:
+            for raw_log in self._get_logs({
+                'address': self.uniswap_factory_address,
+                'topics': topics,
+                'fromBlock': from_block,
+                'toBlock': to_block
+            }):
+                # Cheap string compare before the ABI decode - guards
+                # against permissive providers returning non-factory
+                # logs, which would otherwise cost a decode (or raise)
+                if raw_log['address'].lower() != self._factory_lc:
+                    continue
+                log_key = (raw_log['transactionHash'], raw_log['logIndex'])
+                if log_key not in seen_logs:
+                    seen_logs.add(log_key)
+                    events.append(self.decode_pool_created(raw_log))
+
+        if to_block <= self._latest_block - FINALITY_CONFIRMATIONS:
+            self._log_cache[cache_key] = tuple(events)
+            if len(self._log_cache) > LOG_CACHE_MAX:
+                self._log_cache.popitem(last=False)
+
+        logger.debug("✅ Retrieved %s events successfully", len(events))
+        return events
@@ -6,8 +6,9 @@ Configuration Management
 """
 
 import os
-from typing import List
-from pydantic import BaseModel, field_validator
+from functools import cached_property, lru_cache
+from typing import Tuple
+from pydantic import BaseModel, ConfigDict, field_validator
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,7 +16,10 @@ load_dotenv()
 
 class Settings(BaseModel):
     """Type-safe configuration with validation"""
-    
+
+    model_config = ConfigDict(str_strip_whitespace=True, validate_default=False)
+
+
     # Required Blockchain Settings
     infura_api_key: str
     token_address: str
@@ -34,12 +38,15 @@ class Settings(BaseModel):
     polling_interval: int = 12
     min_liquidity_threshold: int = 1000
     liquidity_check_interval: int = 30
+    max_blocks_per_step: int = 2000
+    min_blocks_per_step: int = 50
     
     # System Settings
     database_path: str = "pool_listener.db"
     metrics_port: int = 8000
     max_worker_threads: int = 5
     log_level: str = "INFO"
+    use_websocket: bool = False
     
     # Notification Channels (apprise format)
     notification_urls: str = ""
@@ -58,34 +65,35 @@ class Settings(BaseModel):
             raise ValueError('Invalid Infura API key')
         return v
     
-    @property
-    def receiver_emails(self) -> List[str]:
-        return [email.strip() for email in self.receiver_email.split(',')]
-    
-    @property
+    # cached_property - these derive from immutable fields, so each is
+    # computed once per Settings instance instead of per access (the
+    # email split runs in the notification hot path)
+    @cached_property
+    def receiver_emails(self) -> Tuple[str, ...]:
+        return tuple(
+            email.strip() for email in self.receiver_email.split(',') if email.strip()
+        )
+
+    @cached_property
     def infura_url(self) -> str:
         return f"https://mainnet.infura.io/v3/{self.infura_api_key}"
 
+    @cached_property
+    def infura_ws_url(self) -> str:
+        return f"wss://mainnet.infura.io/ws/v3/{self.infura_api_key}"
+
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load and validate settings from environment"""
+    """Load and validate settings from environment (cached after first call)
+
+    Field names map 1:1 to uppercased env vars, so one pass over
+    os.environ feeds model_validate and pydantic-core does all the
+    int/bool coercion instead of hand-rolled int(os.getenv(...)) calls.
+    """
     try:
-        return Settings(
-            infura_api_key=os.getenv('INFURA_API_KEY'),
-            token_address=os.getenv('TOKEN_ADDRESS'),
-            sender_email=os.getenv('SENDER_EMAIL'),
-            receiver_email=os.getenv('RECEIVER_EMAIL'),
-            email_password=os.getenv('EMAIL_PASSWORD'),
-            smtp_server=os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
-            smtp_port=int(os.getenv('SMTP_PORT', '587')),
-            polling_interval=int(os.getenv('POLLING_INTERVAL', '12')),
-            token_symbol=os.getenv('TOKEN_SYMBOL', 'TOKEN'),
-            min_liquidity_threshold=int(os.getenv('MIN_LIQUIDITY_THRESHOLD', '1000')),
-            liquidity_check_interval=int(os.getenv('LIQUIDITY_CHECK_INTERVAL', '30')),
-            database_path=os.getenv('DATABASE_PATH', 'pool_listener.db'),
-            metrics_port=int(os.getenv('METRICS_PORT', '8000')),
-            max_worker_threads=int(os.getenv('MAX_WORKER_THREADS', '5')),
-            log_level=os.getenv('LOG_LEVEL', 'INFO'),
-            notification_urls=os.getenv('NOTIFICATION_URLS', '')
-        )
+        return Settings.model_validate({
+            key.lower(): value for key, value in os.environ.items()
+            if key.lower() in Settings.model_fields
+        })
     except Exception as e:
-        raise ValueError(f"Configuration error: {e}") 
\ No newline at end of file
+        raise ValueError(f"Configuration error: {e}")
\ No newline at end of file
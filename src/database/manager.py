@@ -56,15 +56,46 @@ class DatabaseManager:
                 ''')
                 
                 conn.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_pools_address 
+                    CREATE TABLE IF NOT EXISTS metadata (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL
+                    )
+                ''')
+
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_pools_address
                     ON discovered_pools(address)
                 ''')
                 
                 conn.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_pools_tradeable 
+                    CREATE INDEX IF NOT EXISTS idx_pools_tradeable
                     ON discovered_pools(is_tradeable)
                 ''')
-                
+
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_pools_discovered_at
+                    ON discovered_pools(discovered_at DESC)
+                ''')
+
+                # Partial composite index for the sweep query - the
+                # planner walks it already ordered by discovered_at, so
+                # get_non_tradeable_pools needs no sort step, and it
+                # only stores the (small) non-tradeable subset
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_pools_nontradeable_disc
+                    ON discovered_pools(is_tradeable, discovered_at DESC)
+                    WHERE is_tradeable = FALSE
+                ''')
+
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_notif_sent_at
+                    ON notification_log(sent_at DESC)
+                ''')
+
+                # Refresh planner statistics so the partial index is
+                # actually chosen for the sweep query
+                conn.execute('ANALYZE discovered_pools')
+
                 conn.commit()
                 logger.info("✅ Database initialized successfully")
                 
@@ -82,6 +113,18 @@ class DatabaseManager:
                 timeout=30.0
             )
             self._local.connection.row_factory = sqlite3.Row
+            # WAL lets readers (dashboard, sweep threads) run alongside
+            # a writer; NORMAL drops the per-commit fsync that FULL pays
+            # in WAL. journal_mode persists in the DB file, the rest are
+            # per-connection and must be set on every thread's handle
+            self._local.connection.executescript('''
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+                PRAGMA cache_size=-65536;
+                PRAGMA wal_autocheckpoint=1000;
+            ''')
         
         try:
             yield self._local.connection
@@ -92,30 +135,66 @@ class DatabaseManager:
             # Don't close connection here, keep it for reuse
             pass
     
+    # UPSERT instead of INSERT OR REPLACE - a re-save of a known pool
+    # updates its liquidity in place, keeping the original row id,
+    # discovered_at and initial_liquidity instead of rewriting the row
+    SQL_UPSERT_POOL = '''
+        INSERT INTO discovered_pools
+        (address, token0, token1, fee, initial_liquidity, current_liquidity, is_tradeable)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(address) DO UPDATE SET
+            current_liquidity = excluded.current_liquidity,
+            is_tradeable = excluded.is_tradeable,
+            last_updated = CURRENT_TIMESTAMP
+    '''
+
+    @staticmethod
+    def _pool_row(pool_data: Dict) -> tuple:
+        """Build the parameter tuple for SQL_UPSERT_POOL"""
+        return (
+            pool_data['address'],
+            pool_data['token0'],
+            pool_data['token1'],
+            pool_data['fee'],
+            pool_data['liquidity'],
+            pool_data['liquidity'],
+            pool_data['liquidity'] >= 1000  # Default threshold
+        )
+
     def save_pool(self, pool_data: Dict) -> bool:
         """Save discovered pool to database"""
         try:
             with self.get_connection() as conn:
-                conn.execute('''
-                    INSERT OR REPLACE INTO discovered_pools 
-                    (address, token0, token1, fee, initial_liquidity, current_liquidity, is_tradeable)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    pool_data['address'],
-                    pool_data['token0'],
-                    pool_data['token1'],
-                    pool_data['fee'],
-                    pool_data['liquidity'],
-                    pool_data['liquidity'],
-                    pool_data['liquidity'] >= 1000  # Default threshold
-                ))
+                conn.execute(self.SQL_UPSERT_POOL, self._pool_row(pool_data))
                 conn.commit()
-                logger.debug(f"💾 Pool saved: {pool_data['address']}")
+                logger.debug("💾 Pool saved: %s", pool_data['address'])
                 return True
-                
+
         except sqlite3.Error as e:
             logger.error(f"❌ Failed to save pool {pool_data.get('address', 'unknown')}: {e}")
             return False
+
+    def save_pools_bulk(self, pool_list: List[Dict]) -> int:
+        """Save many discovered pools in one transaction
+
+        executemany plus a single commit, so a catch-up burst of N
+        PoolCreated events costs one fsync instead of N.
+        """
+        if not pool_list:
+            return 0
+        try:
+            with self.get_connection() as conn:
+                conn.executemany(
+                    self.SQL_UPSERT_POOL,
+                    [self._pool_row(pool_data) for pool_data in pool_list]
+                )
+                conn.commit()
+                logger.debug("💾 Saved %s pools in bulk", len(pool_list))
+                return len(pool_list)
+
+        except sqlite3.Error as e:
+            logger.error(f"❌ Failed to bulk-save {len(pool_list)} pools: {e}")
+            return 0
     
     def get_non_tradeable_pools(self) -> List[Dict]:
         """Get pools that are not yet tradeable"""
@@ -151,7 +230,33 @@ class DatabaseManager:
             logger.error(f"❌ Failed to mark pool tradeable {pool_address}: {e}")
             return False
     
-    def log_notification(self, pool_address: str, notification_type: str, 
+    def mark_pools_tradeable(self, updates: List[tuple]) -> bool:
+        """Mark many pools tradeable in one transaction
+
+        Takes (address, liquidity) tuples; executemany inside a single
+        commit means a burst of transitions costs one fsync instead of
+        one per pool.
+        """
+        if not updates:
+            return True
+        try:
+            with self.get_connection() as conn:
+                conn.executemany('''
+                    UPDATE discovered_pools
+                    SET is_tradeable = TRUE,
+                        current_liquidity = ?,
+                        last_updated = CURRENT_TIMESTAMP
+                    WHERE address = ?
+                ''', [(liquidity, address) for address, liquidity in updates])
+                conn.commit()
+                logger.info(f"✅ Marked {len(updates)} pools tradeable")
+                return True
+
+        except sqlite3.Error as e:
+            logger.error(f"❌ Failed to mark {len(updates)} pools tradeable: {e}")
+            return False
+
+    def log_notification(self, pool_address: str, notification_type: str,
                         success: bool, channels: str, error: str = None) -> bool:
         """Log notification attempt"""
         try:
@@ -168,6 +273,33 @@ class DatabaseManager:
             logger.error(f"❌ Failed to log notification: {e}")
             return False
     
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a value from the metadata key/value store"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.execute('SELECT value FROM metadata WHERE key = ?', (key,))
+                row = cursor.fetchone()
+                return row['value'] if row else None
+
+        except sqlite3.Error as e:
+            logger.error(f"❌ Failed to read metadata {key}: {e}")
+            return None
+
+    def set_meta(self, key: str, value) -> bool:
+        """Write a value to the metadata key/value store"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO metadata (key, value)
+                    VALUES (?, ?)
+                ''', (key, str(value)))
+                conn.commit()
+                return True
+
+        except sqlite3.Error as e:
+            logger.error(f"❌ Failed to write metadata {key}: {e}")
+            return False
+
     def get_stats(self) -> Dict:
         """Get database statistics"""
         try:
@@ -5,8 +5,9 @@ Metrics Server
 - Performance tracking
 """
 
+import gzip
 import logging
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 import threading
 import time
@@ -15,41 +16,24 @@ from prometheus_client import Counter, Histogram, Gauge, generate_latest, Collec
 
 logger = logging.getLogger(__name__)
 
-class MetricsHandler(BaseHTTPRequestHandler):
-    """HTTP handler for metrics and dashboard"""
-    
-    def do_GET(self):
-        """Handle GET requests"""
-        parsed_path = urlparse(self.path)
-        
-        if parsed_path.path == '/':
-            self.serve_dashboard()
-        elif parsed_path.path == '/metrics':
-            self.serve_metrics()
-        elif parsed_path.path == '/health':
-            self.serve_health()
-        else:
-            self.send_error(404, "Not Found")
-    
-    def serve_dashboard(self):
-        """Serve HTML dashboard"""
-        dashboard_html = f"""
-<!DOCTYPE html>
+# Static dashboard shell - the CSS never changes, so it is encoded once
+# at import instead of being rebuilt inside a multi-KB f-string per GET
+DASHBOARD_HEAD = """<!DOCTYPE html>
 <html>
 <head>
     <title>🔍 Pool Listener Dashboard</title>
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1">
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             margin: 0;
             padding: 20px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             min-height: 100vh;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: rgba(255, 255, 255, 0.1);
@@ -57,38 +41,38 @@ class MetricsHandler(BaseHTTPRequestHandler):
             border-radius: 20px;
             padding: 30px;
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        }}
-        h1 {{
+        }
+        h1 {
             text-align: center;
             margin-bottom: 40px;
             font-size: 2.5em;
             text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
-        }}
-        .stats-grid {{
+        }
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: rgba(255, 255, 255, 0.15);
             padding: 25px;
             border-radius: 15px;
             text-align: center;
             backdrop-filter: blur(5px);
             border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 2.5em;
             font-weight: bold;
             margin-bottom: 10px;
             color: #4CAF50;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             font-size: 1.1em;
             opacity: 0.9;
-        }}
-        .status {{
+        }
+        .status {
             background: rgba(76, 175, 80, 0.2);
             color: #4CAF50;
             padding: 10px 20px;
@@ -96,14 +80,14 @@ class MetricsHandler(BaseHTTPRequestHandler):
             display: inline-block;
             margin: 10px;
             border: 2px solid #4CAF50;
-        }}
-        .links {{
+        }
+        .links {
             display: flex;
             justify-content: center;
             gap: 20px;
             margin-top: 30px;
-        }}
-        .link {{
+        }
+        .link {
             background: rgba(255, 255, 255, 0.2);
             color: white;
             padding: 12px 25px;
@@ -111,77 +95,127 @@ class MetricsHandler(BaseHTTPRequestHandler):
             border-radius: 25px;
             border: 2px solid white;
             transition: all 0.3s ease;
-        }}
-        .link:hover {{
+        }
+        .link:hover {
             background: white;
             color: #667eea;
-        }}
-        .refresh {{
+        }
+        .refresh {
             text-align: center;
             margin-top: 20px;
             opacity: 0.7;
-        }}
+        }
     </style>
     <script>
         // Auto-refresh every 30 seconds
-        setTimeout(function() {{
+        setTimeout(function() {
             location.reload();
-        }}, 30000);
+        }, 30000);
     </script>
 </head>
-<body>
+""".encode('utf-8')
+
+# Per-request part - only the stat numbers and timestamp vary
+DASHBOARD_BODY_TEMPLATE = """<body>
     <div class="container">
         <h1>🔍 Enhanced Pool Listener Dashboard</h1>
-        
+
         <div class="status">
-            🚀 ACTIVE - Monitoring {self.server.metrics_server.get_token_symbol()} Pools
+            🚀 ACTIVE - Monitoring {symbol} Pools
         </div>
-        
+
         <div class="stats-grid">
             <div class="stat-card">
-                <div class="stat-number">{self.server.metrics_server.get_pools_discovered()}</div>
+                <div class="stat-number">{pools}</div>
                 <div class="stat-label">📊 Pools Discovered</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{self.server.metrics_server.get_notifications_sent()}</div>
+                <div class="stat-number">{notifs}</div>
                 <div class="stat-label">📧 Notifications Sent</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{self.server.metrics_server.get_liquidity_checks()}</div>
+                <div class="stat-number">{checks}</div>
                 <div class="stat-label">💰 Liquidity Checks</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{self.server.metrics_server.get_active_pools()}</div>
+                <div class="stat-number">{active}</div>
                 <div class="stat-label">🎯 Active Pools</div>
             </div>
         </div>
-        
+
         <div class="links">
             <a href="/metrics" class="link">📊 Prometheus Metrics</a>
             <a href="/health" class="link">❤️ Health Check</a>
         </div>
-        
+
         <div class="refresh">
-            Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')} | Auto-refresh in 30s
+            Last updated: {ts} | Auto-refresh in 30s
         </div>
     </div>
 </body>
 </html>
 """
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """HTTP handler for metrics and dashboard"""
+    
+    def do_GET(self):
+        """Handle GET requests"""
+        parsed_path = urlparse(self.path)
         
+        if parsed_path.path == '/':
+            self.serve_dashboard()
+        elif parsed_path.path == '/metrics':
+            self.serve_metrics()
+        elif parsed_path.path == '/health':
+            self.serve_health()
+        else:
+            self.send_error(404, "Not Found")
+    
+    def serve_dashboard(self):
+        """Serve HTML dashboard"""
+        metrics_server = self.server.metrics_server
+        body = DASHBOARD_BODY_TEMPLATE.format_map({
+            'symbol': metrics_server.get_token_symbol(),
+            'pools': metrics_server.get_pools_discovered(),
+            'notifs': metrics_server.get_notifications_sent(),
+            'checks': metrics_server.get_liquidity_checks(),
+            'active': metrics_server.get_active_pools(),
+            'ts': datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')
+        }).encode('utf-8')
+
         self.send_response(200)
         self.send_header('Content-Type', 'text/html')
-        self.end_headers()
-        self.wfile.write(dashboard_html.encode('utf-8'))
-    
+        if self._accepts_gzip():
+            # Mostly-repetitive CSS compresses ~4x; level 1 keeps the
+            # per-request CPU cost trivial for a few KB of HTML
+            payload = gzip.compress(DASHBOARD_HEAD + body, compresslevel=1)
+            self.send_header('Content-Encoding', 'gzip')
+            self.end_headers()
+            self.wfile.write(payload)
+        else:
+            self.end_headers()
+            # Static shell bytes + small formatted body - no multi-KB
+            # f-string rebuild or full-page encode per request
+            self.wfile.write(DASHBOARD_HEAD)
+            self.wfile.write(body)
+
     def serve_metrics(self):
         """Serve Prometheus metrics"""
-        metrics_data = generate_latest(self.server.metrics_server.registry)
-        
+        gzipped = self._accepts_gzip()
+        metrics_data = self.server.metrics_server.get_metrics_payload(gzipped=gzipped)
+
         self.send_response(200)
         self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Cache-Control', 'max-age=5')
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
         self.end_headers()
         self.wfile.write(metrics_data)
+
+    def _accepts_gzip(self) -> bool:
+        """Whether the client advertises gzip support"""
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
     
     def serve_health(self):
         """Serve health check"""
@@ -211,6 +245,19 @@ class MetricsServer:
         self.registry = CollectorRegistry()
         self.start_time = time.time()
         self.token_symbol = "Unknown"
+        # Denormalized totals kept alongside the Prometheus counters -
+        # the dashboard and /health read these plain ints instead of
+        # walking every label permutation via collect() per request
+        self._totals_lock = threading.Lock()
+        self._pools_total = 0
+        self._notifs_total = 0
+        self._liq_checks_total = 0
+        # /metrics text snapshot - generate_latest walks and formats
+        # every collector, so regenerate at most once per TTL instead
+        # of per scrape (Prometheus scrape intervals are >= 15s anyway)
+        self._metrics_lock = threading.Lock()
+        self._metrics_cache = (0.0, b'', b'')
+        self._metrics_ttl = 5.0
         self.setup_metrics()
         self.server = None
     
@@ -249,7 +296,53 @@ class MetricsServer:
             'Number of pools being monitored',
             registry=self.registry
         )
+
+        self.tradeable_pools_gauge = Gauge(
+            'tradeable_pools_total',
+            'Number of pools with sufficient liquidity',
+            registry=self.registry
+        )
     
+    def inc_pools_discovered(self, token_symbol: str):
+        """Count a discovered pool (Prometheus counter + cached total)"""
+        self.pools_discovered_total.labels(token_symbol=token_symbol).inc()
+        with self._totals_lock:
+            self._pools_total += 1
+
+    def inc_notifications_sent(self, notification_type: str, channel: str):
+        """Count a sent notification (Prometheus counter + cached total)"""
+        self.notifications_sent_total.labels(
+            notification_type=notification_type, channel=channel
+        ).inc()
+        with self._totals_lock:
+            self._notifs_total += 1
+
+    def inc_liquidity_checks(self, status: str):
+        """Count a liquidity check (Prometheus counter + cached total)"""
+        self.liquidity_checks_total.labels(status=status).inc()
+        with self._totals_lock:
+            self._liq_checks_total += 1
+
+    def get_metrics_payload(self, gzipped: bool = False) -> bytes:
+        """Exposition-format snapshot, regenerated at most once per TTL
+
+        The gzip blob is made at cache-refresh time (exposition text is
+        highly repetitive), so compressed scrapes cost nothing extra
+        per request.
+        """
+        now = time.time()
+        generated_at, raw, compressed = self._metrics_cache
+        if now - generated_at <= self._metrics_ttl:
+            return compressed if gzipped else raw
+        with self._metrics_lock:
+            generated_at, raw, compressed = self._metrics_cache
+            if now - generated_at <= self._metrics_ttl:
+                return compressed if gzipped else raw
+            raw = generate_latest(self.registry)
+            compressed = gzip.compress(raw, compresslevel=1)
+            self._metrics_cache = (now, raw, compressed)
+            return compressed if gzipped else raw
+
     def set_token_symbol(self, symbol: str):
         """Set the token symbol for display"""
         self.token_symbol = symbol
@@ -260,36 +353,15 @@ class MetricsServer:
     
     def get_pools_discovered(self) -> int:
         """Get total pools discovered"""
-        try:
-            # Sum all values across different label combinations
-            total = 0
-            for sample in self.pools_discovered_total.collect()[0].samples:
-                total += sample.value
-            return int(total)
-        except:
-            return 0
-    
+        return self._pools_total
+
     def get_notifications_sent(self) -> int:
         """Get total notifications sent"""
-        try:
-            # Sum all values across different label combinations
-            total = 0
-            for sample in self.notifications_sent_total.collect()[0].samples:
-                total += sample.value
-            return int(total)
-        except:
-            return 0
-    
+        return self._notifs_total
+
     def get_liquidity_checks(self) -> int:
         """Get total liquidity checks"""
-        try:
-            # Sum all values across different label combinations
-            total = 0
-            for sample in self.liquidity_checks_total.collect()[0].samples:
-                total += sample.value
-            return int(total)
-        except:
-            return 0
+        return self._liq_checks_total
     
     def get_active_pools(self) -> int:
         """Get active pools count"""
@@ -301,7 +373,9 @@ class MetricsServer:
     def start(self):
         """Start metrics server"""
         try:
-            self.server = HTTPServer(('0.0.0.0', self.port), MetricsHandler)
+            # Threading server - a slow /metrics scrape must not block
+            # /health liveness probes
+            self.server = ThreadingHTTPServer(('0.0.0.0', self.port), MetricsHandler)
             self.server.metrics_server = self  # Pass reference
             
             # Start in background thread
@@ -6,7 +6,9 @@ Notification Manager
 """
 
 import asyncio
+import atexit
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
@@ -19,6 +21,63 @@ from .templates.email import EmailTemplates
 
 logger = logging.getLogger(__name__)
 
+class SmtpSession:
+    """Lazily-opened SMTP connection reused across notifications
+
+    Opening a socket, running STARTTLS and logging in costs several
+    round trips per email; one long-lived session amortizes that across
+    a burst of notifications. A NOOP probe before each send detects
+    idle disconnects and triggers a single reconnect.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self.server = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a fresh connection"""
+        server = smtplib.SMTP(self.settings.smtp_server, self.settings.smtp_port)
+        server.starttls()
+        server.login(self.settings.sender_email, self.settings.email_password)
+        return server
+
+    def send(self, msg):
+        """Send a message over the shared connection, reconnecting once"""
+        with self._lock:
+            if self.server is not None:
+                try:
+                    self.server.noop()
+                except (smtplib.SMTPException, OSError):
+                    self._drop()
+            if self.server is None:
+                self.server = self._connect()
+            try:
+                self.server.send_message(msg)
+            except (smtplib.SMTPException, OSError):
+                self._drop()
+                self.server = self._connect()
+                self.server.send_message(msg)
+
+    def _drop(self):
+        """Discard a dead connection (best effort)"""
+        try:
+            self.server.close()
+        except Exception:
+            pass
+        self.server = None
+
+    def close(self):
+        """Close the connection politely at shutdown"""
+        with self._lock:
+            if self.server is not None:
+                try:
+                    self.server.quit()
+                except Exception:
+                    pass
+                self.server = None
+
 class NotificationManager:
     """Manage multi-channel notifications with beautiful templates"""
     
@@ -27,6 +86,7 @@ class NotificationManager:
         self.apobj = apprise.Apprise()
         self.discord_templates = DiscordTemplates()
         self.email_templates = EmailTemplates()
+        self.smtp_session = SmtpSession(settings)
         self.setup_channels()
     
     def setup_channels(self):
@@ -93,11 +153,8 @@ class NotificationManager:
             html_part = MIMEText(html_body, 'html')
             msg.attach(html_part)
             
-            # Send email
-            with smtplib.SMTP(self.settings.smtp_server, self.settings.smtp_port) as server:
-                server.starttls()
-                server.login(self.settings.sender_email, self.settings.email_password)
-                server.send_message(msg)
+            # Send email over the persistent session
+            self.smtp_session.send(msg)
             
             logger.info(f"📧 Beautiful HTML email sent to {len(self.settings.receiver_emails)} recipients")
             
@@ -36,7 +36,10 @@ class TestSettings(unittest.TestCase):
         
         for key, value in self.env_vars.items():
             os.environ[key] = value
-    
+
+        # load_settings is cached, so each test needs a fresh read of the env
+        load_settings.cache_clear()
+
     def tearDown(self):
         """Clean up environment variables"""
         for key in self.env_vars:
@@ -122,6 +125,79 @@ class TestDatabaseManager(unittest.TestCase):
         pools = self.db.get_non_tradeable_pools()
         self.assertEqual(len(pools), 0)
 
+    def test_meta_round_trip(self):
+        """Test metadata key/value store read/write"""
+        self.assertIsNone(self.db.get_meta('last_processed_block'))
+
+        self.db.set_meta('last_processed_block', 12345)
+        self.assertEqual(self.db.get_meta('last_processed_block'), '12345')
+
+        # INSERT OR REPLACE - a second write overwrites
+        self.db.set_meta('last_processed_block', 12400)
+        self.assertEqual(self.db.get_meta('last_processed_block'), '12400')
+
+    def test_meta_survives_restart(self):
+        """Test resuming from the persisted block after a restart"""
+        self.db.set_meta('last_processed_block', 99999)
+
+        # Reopen the same file as a fresh manager - simulates a restart
+        self.db.close()
+        self.db = DatabaseManager(self.temp_db.name)
+        self.assertEqual(self.db.get_meta('last_processed_block'), '99999')
+
+    def test_save_pools_bulk(self):
+        """Test bulk pool save in one transaction"""
+        pool_list = [
+            {
+                'address': f'0x{i:040x}',
+                'token0': '0xtoken0',
+                'token1': '0xtoken1',
+                'fee': 3000,
+                'liquidity': 500  # Below threshold
+            }
+            for i in range(1, 4)
+        ]
+
+        saved = self.db.save_pools_bulk(pool_list)
+        self.assertEqual(saved, 3)
+        self.assertEqual(self.db.get_stats()['total_pools'], 3)
+
+        # Empty input is a no-op, not an error
+        self.assertEqual(self.db.save_pools_bulk([]), 0)
+
+        # Re-saving is an upsert - liquidity updates, no duplicate rows
+        pool_list[0]['liquidity'] = 750
+        self.assertEqual(self.db.save_pools_bulk(pool_list), 3)
+        self.assertEqual(self.db.get_stats()['total_pools'], 3)
+        pools = {p['address']: p for p in self.db.get_non_tradeable_pools()}
+        self.assertEqual(pools[pool_list[0]['address']]['current_liquidity'], 750)
+
+    def test_mark_pools_tradeable_bulk(self):
+        """Test marking many pools tradeable in one transaction"""
+        pool_list = [
+            {
+                'address': f'0x{i:040x}',
+                'token0': '0xtoken0',
+                'token1': '0xtoken1',
+                'fee': 3000,
+                'liquidity': 500  # Below threshold
+            }
+            for i in range(1, 4)
+        ]
+        self.db.save_pools_bulk(pool_list)
+
+        # Mark two of the three tradeable
+        updates = [(pool_list[0]['address'], 2000), (pool_list[1]['address'], 3000)]
+        self.assertTrue(self.db.mark_pools_tradeable(updates))
+
+        pools = self.db.get_non_tradeable_pools()
+        self.assertEqual(len(pools), 1)
+        self.assertEqual(pools[0]['address'], pool_list[2]['address'])
+        self.assertEqual(self.db.get_stats()['tradeable_pools'], 2)
+
+        # Empty input is a no-op, not an error
+        self.assertTrue(self.db.mark_pools_tradeable([]))
+
 class TestNotificationManager(unittest.TestCase):
     """Test notification manager"""
     
@@ -143,8 +219,9 @@ class TestNotificationManager(unittest.TestCase):
     @patch('src.notifications.manager.smtplib.SMTP')
     def test_email_notification(self, mock_smtp):
         """Test email notification sending"""
-        mock_server = MagicMock()
-        mock_smtp.return_value.__enter__.return_value = mock_server
+        # The persistent SmtpSession calls smtplib.SMTP directly (no
+        # context manager) and keeps the connection for reuse
+        mock_server = mock_smtp.return_value
         
         # Run the async function in event loop
         async def run_test():